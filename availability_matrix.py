@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+# Values used for cells without a saved availability row
+DEFAULT_AVAILABLE = True
+DEFAULT_CAN_PLAY_CATCHER = False
+
+
+def from_availability(lineup, availability):
+    """Build players x games boolean matrices from db_operations.get_player_availability output
+
+    Rows follow lineup.players and columns lineup.games; cells without a saved row get the defaults.
+
+    Returns:
+        tuple: (available, can_play_catcher) boolean arrays
+    """
+    available = np.full((len(lineup.players), len(lineup.games)), DEFAULT_AVAILABLE, dtype=bool)
+    can_play_catcher = np.full(available.shape, DEFAULT_CAN_PLAY_CATCHER, dtype=bool)
+    for game_number, game_data in availability.items():
+        column = lineup.game_index.get(int(game_number))
+        if column is None:
+            continue
+        for matrix, key in ((available, "Available"), (can_play_catcher, "Can Play Catcher")):
+            for jersey, value in game_data.get(key, {}).items():
+                row = lineup.index_of(jersey)
+                if row is not None and value is not None:
+                    matrix[row, column] = bool(value)
+    return available, can_play_catcher
+
+def column_labels(lineup):
+    """Editor column label per game, e.g. "G3 vs Tigers" """
+    return [f"G{game.game_number} vs {game.opponent}" for game in lineup.games]
+
+def to_frame(lineup, matrix):
+    """Players x games DataFrame of a matrix for st.data_editor"""
+    return pd.DataFrame(matrix, index=lineup.labels(), columns=column_labels(lineup))
+
+def from_frame(frame):
+    """Boolean matrix back from an edited to_frame DataFrame"""
+    return frame.fillna(False).to_numpy(dtype=bool)
+
+def changed_cells(lineup, available, can_play_catcher, new_available, new_can_play_catcher):
+    """Cells where either matrix changed, as db_operations.update_availability_cells input
+
+    Returns:
+        list: (jersey, game_number, available, can_play_catcher) tuples
+    """
+    rows, columns = np.nonzero((available != new_available) | (can_play_catcher != new_can_play_catcher))
+    return [
+        (lineup.players[row].jersey, lineup.games[column].game_number,
+         bool(new_available[row, column]), bool(new_can_play_catcher[row, column]))
+        for row, column in zip(rows, columns)
+    ]
@@ -0,0 +1,125 @@
+import numpy as np
+
+# Slots per band when planning a day: top, middle and bottom of the order
+DAY_BANDS = 3
+# Cost of batting again in a band already batted in earlier that day, in season slot counts
+DAY_WEIGHT = 4
+
+
+def slot_counts(lineup, orders, available=None, skip=()):
+    """Count how often each player has batted in each slot of the saved orders
+
+    Args:
+        lineup (Lineup): Team players and games; rows and slots follow lineup.players
+        orders (dict): {game_number: [jersey, ...]} as returned by db_operations.get_batting_orders
+        available (ndarray): Optional players x games availability; unavailable players aren't counted
+        skip (iterable): Game numbers to leave out
+
+    Returns:
+        ndarray: players x slots counts, slot 0 being leadoff
+    """
+    size = len(lineup.players)
+    counts = np.zeros((size, size), dtype=np.int32)
+    skip = {int(game_number) for game_number in skip}
+    for game_number, order in orders.items():
+        column = lineup.game_index.get(int(game_number))
+        if column is None or int(game_number) in skip:
+            continue
+        slot = 0
+        for jersey in order or []:
+            row = lineup.index_of(jersey)
+            if row is None or (available is not None and not available[row, column]):
+                continue
+            if slot < size:
+                counts[row, slot] += 1
+            slot += 1
+    return counts
+
+def plan_game(counts, rows, extra=None):
+    """Order one game's available players, updating `counts` in place
+
+    Tries every rotation of `rows` (a Latin-square schedule across games) and keeps the one
+    whose players have batted least in their new slots, which keeps the season's sum of
+    squared slot counts as low as a rotation can.
+
+    Args:
+        counts (ndarray): players x slots counts
+        rows (sequence): Row indices of the players batting
+        extra (ndarray): Optional players x slots cost added when choosing (not updated)
+
+    Returns:
+        list: Row indices in batting order
+    """
+    rows = np.asarray(rows, dtype=np.intp)
+    size = len(rows)
+    if size == 0:
+        return []
+    slots = np.arange(size)
+    # rotations[r, s]: position in `rows` of the player batting in slot s under rotation r
+    rotations = (slots[:, None] + slots[None, :]) % size
+    cost = counts[rows[rotations], slots].sum(axis=1)
+    if extra is not None:
+        cost = cost + extra[rows[rotations], slots].sum(axis=1)
+    order = rows[rotations[int(np.argmin(cost))]]
+    counts[order, slots] += 1
+    return order.tolist()
+
+def plan_season(lineup, available, counts=None, games=None):
+    """Generate batting orders that spread each player's slots evenly over the season
+
+    Games are planned in schedule order. Available players fill the order; unavailable
+    players follow in roster order, as Auto-arrange has always placed them.
+
+    Args:
+        lineup (Lineup): Team players and games
+        available (ndarray): players x games availability matrix
+        counts (ndarray): Slot counts to start from (e.g. slot_counts of the games being kept)
+        games (iterable): Game numbers to plan; defaults to every game
+
+    Returns:
+        dict: {game_number: [jersey, ...]}
+    """
+    size = len(lineup.players)
+    counts = np.zeros((size, size), dtype=np.int32) if counts is None else counts.copy()
+    wanted = None if games is None else {int(game_number) for game_number in games}
+    orders = {}
+    for game in lineup.games:
+        if wanted is not None and game.game_number not in wanted:
+            continue
+        present = available[:, game.index]
+        order = plan_game(counts, np.flatnonzero(present)) + np.flatnonzero(~present).tolist()
+        orders[game.game_number] = [lineup.players[row].jersey for row in order]
+    return orders
+
+def plan_day(lineup, available, games, counts=None, day_weight=DAY_WEIGHT):
+    """Batting orders for several games on the same day, planned together
+
+    Like plan_season, but a player who batted in the top, middle or bottom of the order
+    earlier that day is steered to a different part of the order in the next game.
+
+    Args:
+        lineup (Lineup): Team players and games
+        available (ndarray): players x games availability matrix
+        games (list): Game numbers in the order they're played
+        counts (ndarray): Slot counts to start from (e.g. slot_counts of the other games)
+        day_weight (float): Cost of repeating a band, relative to one season slot count
+
+    Returns:
+        dict: {game_number: [jersey, ...]}
+    """
+    size = len(lineup.players)
+    counts = np.zeros((size, size), dtype=np.int32) if counts is None else counts.copy()
+    day = np.zeros((size, DAY_BANDS), dtype=np.int32)
+    orders = {}
+    for game_number in games:
+        game = lineup.game(game_number)
+        if game is None:
+            continue
+        present = available[:, game.index]
+        rows = np.flatnonzero(present)
+        bands = np.arange(size) * DAY_BANDS // max(len(rows), 1)
+        extra = day_weight * day[:, np.minimum(bands, DAY_BANDS - 1)]
+        order = plan_game(counts, rows, extra)
+        day[order, np.minimum(bands[:len(order)], DAY_BANDS - 1)] += 1
+        orders[game.game_number] = [lineup.players[row].jersey for row in order + np.flatnonzero(~present).tolist()]
+    return orders
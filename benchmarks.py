@@ -0,0 +1,210 @@
+import json
+import logging
+import statistics
+import sys
+import time
+
+import database
+import query_stats
+
+# Synthetic team sizes; "large" is a full 20-player, 9-inning season
+SIZES = {
+    "small": {"roster_size": 10, "games": 10, "innings": 6},
+    "medium": {"roster_size": 14, "games": 30, "innings": 7},
+    "large": {"roster_size": 20, "games": 80, "innings": 9},
+}
+
+# A case regresses when its median grows by more than this fraction over the baseline
+DEFAULT_THRESHOLD = 0.25
+# Medians below this are too noisy to compare by ratio
+NOISE_FLOOR_MS = 1.0
+
+
+def _load_lineup():
+    """Import the Streamlit app module in bare mode, without its missing-runtime warnings"""
+    logging.disable(logging.WARNING)
+    try:
+        import lineup
+    finally:
+        logging.disable(logging.NOTSET)
+    return lineup
+
+def make_cases(team_id):
+    """Return (name, callable) pairs exercising the read, write, analytics and PDF paths of one team"""
+    import db_operations as db
+    import pdf_cache
+    import pdf_render
+    import rotation_matrix
+
+    lineup = _load_lineup()
+
+    # Writes replay the team's current data, so every iteration does the same work
+    team_info = db.get_team_info(team_id)
+    roster_df = db.get_roster(team_id)
+    schedule_df = db.get_schedule(team_id)
+    batting_orders = db.get_batting_orders(team_id)
+    rotations = db.get_fielding_rotations(team_id)
+    availability = db.get_player_availability(team_id)
+    first_game = int(schedule_df["Game #"].iloc[0])
+    first_inning = rotations.get(first_game, {}).get("Inning 1", {})
+    first_innings = int(schedule_df["Innings"].iloc[0])
+    team_lineup = db.get_lineup(team_id)
+    jerseys = [player.jersey for player in team_lineup]
+    game_plan = lineup.collect_game_plan_data(team_id, first_game)
+
+    def build_pitching_ledger():
+        db._pitching_ledger_cache.clear()
+        db.get_pitching_ledger(team_id)
+
+    def game_pitch_limits():
+        game = team_lineup.game(first_game)
+        lineup.pitching_without_game(team_id, game, rotations.get(first_game, {}), jerseys).limits(jerseys, game.date)
+
+    def generate_pdf_uncached():
+        pdf_cache.pdf_cache.clear()
+        lineup.generate_game_plan_pdf(team_id, first_game)
+
+    return [
+        ("get_roster", lambda: db.get_roster(team_id)),
+        ("get_schedule", lambda: db.get_schedule(team_id)),
+        ("get_batting_orders", lambda: db.get_batting_orders(team_id)),
+        ("get_fielding_rotations", lambda: db.get_fielding_rotations(team_id)),
+        ("get_player_availability", lambda: db.get_player_availability(team_id)),
+        ("update_team", lambda: db.update_team(team_id, team_info)),
+        ("update_roster", lambda: db.update_roster(team_id, roster_df)),
+        ("update_schedule", lambda: db.update_schedule(team_id, schedule_df)),
+        ("update_batting_order", lambda: db.update_batting_order(team_id, first_game, batting_orders.get(first_game, []))),
+        ("update_fielding_rotation", lambda: db.update_fielding_rotation(team_id, first_game, 1, first_inning)),
+        ("update_player_availability", lambda: db.update_player_availability(team_id, first_game, availability[first_game])),
+        ("analyze_batting_fairness", lambda: db.analyze_batting_fairness(team_id)),
+        ("analyze_fielding_fairness", lambda: db.analyze_fielding_fairness(team_id)),
+        ("game_fielding_stats", lambda: rotation_matrix.game_stats(
+            rotations.get(first_game, {}), jerseys, team_lineup.labels(), first_innings
+        )),
+        ("build_pitching_ledger", build_pitching_ledger),
+        ("game_pitch_limits", game_pitch_limits),
+        # Before/after pair: a template built per document against the shared one
+        ("render_game_plan_pdf_new_template", lambda: pdf_render.GamePlanTemplate().render(game_plan)),
+        ("render_game_plan_pdf", lambda: pdf_render.render(game_plan)),
+        ("generate_game_plan_pdf", generate_pdf_uncached),
+        ("generate_game_plan_pdf_cached", lambda: lineup.generate_game_plan_pdf(team_id, first_game)),
+    ]
+
+def measure(func, repeat):
+    """Time a callable and count the SQL statements of one call
+
+    Returns:
+        dict: median_ms, min_ms and statements
+    """
+    # Warm-up call, also used to count statements
+    with query_stats.collect("benchmark") as stats:
+        func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "statements": stats.statements
+    }
+
+def run(sizes=None, repeat=5, cases=None, seed=1):
+    """Generate one synthetic team per size and benchmark every case against it
+
+    Returns:
+        dict: Results keyed by "<size>/<case>"
+    """
+    from generate_league import generate_league
+
+    results = {}
+    for size in sizes or SIZES:
+        league = generate_league(users=1, teams_per_user=1, seed=seed, **SIZES[size])
+        team_id = league["team_ids"][0]
+        try:
+            for name, func in make_cases(team_id):
+                if cases and name not in cases:
+                    continue
+                results[f"{size}/{name}"] = measure(func, repeat)
+        finally:
+            _delete_users(league["user_ids"])
+    return results
+
+def _delete_users(user_ids):
+    """Remove generated users; their teams and season data cascade"""
+    session = database.get_db_session()
+    try:
+        for user in session.query(database.User).filter(database.User.id.in_(user_ids)):
+            session.delete(user)
+        session.commit()
+    finally:
+        session.close()
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return a list of regression messages against a baseline
+
+    A case regresses when it runs more SQL statements than the baseline, or when its median
+    is more than `threshold` slower (ignoring medians under NOISE_FLOOR_MS).
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result["statements"] > base["statements"]:
+            regressions.append(f"{key}: {base['statements']} -> {result['statements']} statements")
+        if (result["median_ms"] > NOISE_FLOOR_MS
+                and result["median_ms"] > base["median_ms"] * (1 + threshold)):
+            regressions.append(f"{key}: {base['median_ms']:.2f} -> {result['median_ms']:.2f} ms")
+    return regressions
+
+def print_results(results, baseline=None):
+    print(f"{'case':<42} {'median ms':>10} {'min ms':>10} {'queries':>8} {'baseline ms':>12}")
+    for key, result in results.items():
+        base = (baseline or {}).get(key)
+        base_ms = f"{base['median_ms']:.2f}" if base else "-"
+        print(f"{key:<42} {result['median_ms']:>10.2f} {result['min_ms']:>10.2f} "
+              f"{result['statements']:>8} {base_ms:>12}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark db_operations, fairness analytics and PDF generation")
+    parser.add_argument("--database-url", default="sqlite:///lineup_benchmark.db",
+                        help="Database to benchmark against; synthetic teams are created and deleted")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--cases", nargs="+", help="Only run these cases (e.g. get_roster update_roster)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", help="Write the results as a JSON baseline")
+    parser.add_argument("--baseline", help="Compare against a JSON baseline and exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction of the baseline median")
+    args = parser.parse_args()
+
+    database.configure(args.database_url)
+    database.create_tables()
+
+    results = run(args.sizes, args.repeat, args.cases, args.seed)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print("No regressions")
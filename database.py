@@ -10,6 +10,8 @@ from dotenv import load_dotenv
 import hashlib
 import secrets
 import uuid
+import query_stats
+import revisions
 
 # Try to load environment variables from .env for local development
 load_dotenv()
@@ -29,18 +31,75 @@ except Exception:
         print("Please set DATABASE_URL in your .env file or Streamlit secrets.")
         # Instead of raising an error immediately, we'll continue and let the app show a proper error message
 
-# Create SQLAlchemy engine
-if DATABASE_URL:
-    engine = create_engine(DATABASE_URL)
-else:
-    # Create a fallback SQLite in-memory engine for development
-    # This will allow the app to start but most database operations will fail gracefully
-    print("WARNING: Using in-memory SQLite database as fallback. Most operations will fail.")
-    engine = create_engine('sqlite:///:memory:')
+# Optional read replica for read-only queries (page loads, analytics, summaries, PDFs)
+try:
+    DATABASE_READ_URL = st.secrets["DATABASE_READ_URL"]
+except Exception:
+    DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+
+# Reads of a team go to the primary for this long after this process writes to it,
+# so users see their own saves despite replication lag
+READ_YOUR_WRITES_SECONDS = float(os.getenv("DATABASE_READ_WINDOW_SECONDS", "10"))
+
+# The engine is created on first use so importing this module stays cheap
+_engine = None
+_session_factory = None
+_read_engine = None
+_read_session_factory = None
+
+def get_engine():
+    """Get the SQLAlchemy engine, creating it on first use"""
+    global _engine
+    if _engine is None:
+        if DATABASE_URL:
+            _engine = create_engine(DATABASE_URL)
+        else:
+            # Create a fallback SQLite in-memory engine for development
+            # This will allow the app to start but most database operations will fail gracefully
+            print("WARNING: Using in-memory SQLite database as fallback. Most operations will fail.")
+            _engine = create_engine('sqlite:///:memory:')
+        # Count statements and DB time per rerun for the developer panel
+        query_stats.install(_engine)
+    return _engine
+
+def get_read_engine():
+    """Get the read replica engine, or the primary engine when no replica is configured"""
+    global _read_engine
+    if not DATABASE_READ_URL:
+        return get_engine()
+    if _read_engine is None:
+        _read_engine = create_engine(DATABASE_READ_URL)
+        query_stats.install(_read_engine)
+    return _read_engine
+
+def configure(url, read_url=None):
+    """Point the module at another database (e.g. a local SQLite file for benchmarks)
+
+    Must be called before the first session is opened; later sessions use the new engine.
+    """
+    global DATABASE_URL, DATABASE_READ_URL, _engine, _session_factory, _read_engine, _read_session_factory
+    for engine in (_engine, _read_engine):
+        if engine is not None:
+            engine.dispose()
+    DATABASE_URL = url
+    DATABASE_READ_URL = read_url
+    _engine = None
+    _session_factory = None
+    _read_engine = None
+    _read_session_factory = None
+
+def __getattr__(name):
+    # Keep `database.engine` working for scripts like migrate_db.py
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Create base class for declarative models
 Base = declarative_base()
 
+# JSONB on PostgreSQL, plain JSON on SQLite so local and benchmark databases work
+JSONType = JSONB().with_variant(JSON(), "sqlite")
+
 # Define database models
 class User(Base):
     __tablename__ = 'users'
@@ -118,7 +177,7 @@ class BattingOrder(Base):
     
     id = Column(Integer, primary_key=True)
     game_id = Column(Integer, ForeignKey('games.id', ondelete='CASCADE'), unique=True)
-    order_data = Column(JSONB)  # Store the list of jersey numbers as JSON
+    order_data = Column(JSONType)  # Store the list of jersey numbers as JSON
     
     # Relationships
     game = relationship("Game", back_populates="batting_order")
@@ -129,7 +188,7 @@ class FieldingRotation(Base):
     id = Column(Integer, primary_key=True)
     game_id = Column(Integer, ForeignKey('games.id', ondelete='CASCADE'))
     inning = Column(Integer, nullable=False)
-    positions = Column(JSONB)  # Store the positions dictionary as JSON
+    positions = Column(JSONType)  # Store the positions dictionary as JSON
     
     # Relationships
     game = relationship("Game", back_populates="fielding_rotations")
@@ -160,12 +219,43 @@ class PlayerAvailability(Base):
 
 # Create all tables in the database
 def create_tables():
-    Base.metadata.create_all(engine)
+    Base.metadata.create_all(get_engine())
 
 # Create a session to interact with the database
 def get_db_session():
-    Session = sessionmaker(bind=engine)
-    return Session()
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=get_engine())
+    return _session_factory()
+
+def reads_use_replica(team_id=None):
+    """Check whether read-only queries for a team can go to the read replica
+
+    Writes are only tracked per process (see revisions), which matches one Streamlit server.
+    """
+    if not DATABASE_READ_URL:
+        return False
+    if team_id is None:
+        return True
+    since = revisions.seconds_since_write(team_id)
+    return since is None or since >= READ_YOUR_WRITES_SECONDS
+
+def read_database_url(team_id=None):
+    """URL that read-only queries for a team should use"""
+    return DATABASE_READ_URL if reads_use_replica(team_id) else DATABASE_URL
+
+def get_read_session(team_id=None):
+    """Create a session for read-only queries
+
+    Uses the read replica when DATABASE_READ_URL is set, except for a team this process
+    wrote to in the last READ_YOUR_WRITES_SECONDS. Never write through this session.
+    """
+    global _read_session_factory
+    if not reads_use_replica(team_id):
+        return get_db_session()
+    if _read_session_factory is None:
+        _read_session_factory = sessionmaker(bind=get_read_engine())
+    return _read_session_factory()
 
 # Helper functions to convert between dataframes and database models
 def roster_df_to_db(team_id, roster_df):
@@ -0,0 +1,247 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+import batting_engine
+import pitching
+import rotation_matrix as rm
+import rotation_solver
+
+# Day-level penalties, on the rotation_solver objective's scale
+FIRST_INNING_WEIGHT = 5.0   # per pair of games a player starts on the bench
+PITCHING_WEIGHT = 5.0       # per pair of games a player pitches in
+DAY_BENCH_WEIGHT = 1.0      # per inning between the most and least benched players over the day
+
+_FIELD = (rm.INFIELD_CAT, rm.OUTFIELD_CAT, rm.BENCH_CAT)
+
+
+def play_order(schedule_index, games):
+    """Game numbers sorted by date, start time and game number (games without a time go last that day)"""
+    def key(number):
+        game_time = schedule_index.game(number).time
+        return schedule_index.dates[number], game_time is None or pd.isna(game_time), str(game_time), number
+    return sorted((int(number) for number in games), key=key)
+
+def same_day_games(schedule_index, game_number):
+    """Game numbers played on the same date as `game_number`, in play order"""
+    date = schedule_index.dates.get(int(game_number))
+    return play_order(schedule_index, [number for number in schedule_index.numbers() if schedule_index.dates[number] == date])
+
+
+class _GameState:
+    """Per-game totals the day objective is summed from, recomputed only for the game a move touches"""
+
+    __slots__ = ("violations", "categories", "positions", "first_bench", "pitched", "bench")
+
+    # Pitch limits are checked per day in _day_parts, as a day's games share them
+
+    def __init__(self, matrix, problem):
+        rows = np.flatnonzero(problem.available)
+        game = matrix[rows]
+        cats = rm.categories(game)
+        per_player = rm.position_counts(game, axis=1)[:, rm.FIELD_CODES]
+        self.violations = rotation_solver.count_violations(game, cats, per_player, problem.can_catch[rows])
+
+        size = len(problem.jerseys)
+        self.categories = np.zeros((size, len(rm.CATEGORY_NAMES)), dtype=np.int32)
+        for category in _FIELD:
+            self.categories[rows, category] = (cats == category).sum(axis=1)
+        self.positions = np.zeros((size, len(rm.FIELD_CODES)), dtype=np.int32)
+        self.positions[rows] = per_player
+        self.first_bench = np.zeros(size, dtype=np.int32)
+        self.pitched = np.zeros(size, dtype=np.int32)
+        if game.shape[1]:
+            self.first_bench[rows] = game[:, 0] == rm.BENCH
+            self.pitched[rows] = per_player[:, rotation_solver.PITCHER_COLUMN]
+        self.bench = self.categories[rows, rm.BENCH_CAT]
+
+
+def _day_parts(states, problems, groups):
+    """Day totals: violations, season bench % spread, coverage, bench spreads, first-inning and pitching repeats
+
+    `groups` lists the problem indices played on each date; their pitch limits are shared.
+    """
+    base = problems[0]
+    ever = np.zeros(len(base.jerseys), dtype=bool)
+    always = np.ones(len(base.jerseys), dtype=bool)
+    for problem in problems:
+        ever |= problem.available
+        always &= problem.available
+    rows = np.flatnonzero(ever)
+
+    counts = base.season_categories + sum(state.categories for state in states)
+    played = counts[rows, :rm.OUT_CAT].sum(axis=1)
+    bench = np.divide(counts[rows, rm.BENCH_CAT], played, out=np.zeros(len(rows)), where=played > 0) * 100
+    positions = base.season_positions[:, rm.FIELD_CODES] + sum(state.positions for state in states)
+
+    # Bench innings over the day, compared between players who are there for every game
+    day_bench = sum(state.categories[:, rm.BENCH_CAT] for state in states)[always]
+    first = sum(state.first_bench for state in states)
+    games_pitched = sum(state.pitched > 0 for state in states)
+    over_limit = 0
+    for group in groups:
+        limit = problems[group[0]].pitch_limit
+        if limit is not None:
+            over_limit += int(np.maximum(sum(states[g].pitched for g in group) - limit, 0).sum())
+    return {
+        "violations": sum(state.violations for state in states) + over_limit,
+        "pitch_limit_excess": over_limit,
+        "bench_spread": float(bench.std()) if len(rows) else 0.0,
+        "coverage": float((positions[rows] > 0).mean() * 100) if len(rows) else 100.0,
+        "game_bench": sum(int(state.bench.max() - state.bench.min()) for state in states if len(state.bench)),
+        "day_bench": (int(day_bench.min()), int(day_bench.max())) if len(day_bench) else (0, 0),
+        "first_inning_repeats": int((first * (first - 1) // 2).sum()),
+        "pitching_repeats": int((games_pitched * (games_pitched - 1) // 2).sum()),
+    }
+
+def _total(parts):
+    return (
+        rotation_solver.VIOLATION_WEIGHT * parts["violations"]
+        + parts["bench_spread"]
+        + rotation_solver.COVERAGE_WEIGHT * (100.0 - parts["coverage"])
+        + rotation_solver.GAME_BENCH_WEIGHT * parts["game_bench"]
+        + DAY_BENCH_WEIGHT * (parts["day_bench"][1] - parts["day_bench"][0])
+        + FIRST_INNING_WEIGHT * parts["first_inning_repeats"]
+        + PITCHING_WEIGHT * parts["pitching_repeats"]
+    )
+
+
+def _construct(problems, groups, rng):
+    """Build every game in play order, each seeing the day's earlier games as part of its season
+    and as innings already pitched that date"""
+    matrices = []
+    season_categories = problems[0].season_categories.copy()
+    season_positions = problems[0].season_positions.copy()
+    group_of = {g: i for i, group in enumerate(groups) for g in group}
+    pitched = [0] * len(groups)
+    for g, problem in enumerate(problems):
+        pitch_limit = None
+        if problem.pitch_limit is not None:
+            pitch_limit = np.maximum(problem.pitch_limit - pitched[group_of[g]], 0)
+        seeded = rotation_solver.Problem(problem.jerseys, problem.available, problem.can_catch, problem.innings,
+                                         season_categories, season_positions, pitch_limit)
+        matrix = rotation_solver.construct(seeded, rng)
+        state = _GameState(matrix, problem)
+        pitched[group_of[g]] = pitched[group_of[g]] + state.pitched
+        season_categories = season_categories + state.categories
+        season_positions = season_positions.copy()
+        season_positions[:, rm.FIELD_CODES] += state.positions
+        matrices.append(matrix)
+    return matrices
+
+def _improve(matrices, problems, groups, rng, deadline, patience=rotation_solver.PATIENCE):
+    """Swap two players within one inning of one game while the day's total doesn't get worse"""
+    states = [_GameState(matrix, problem) for matrix, problem in zip(matrices, problems)]
+    best = _total(_day_parts(states, problems, groups))
+    movable = [g for g, problem in enumerate(problems) if problem.available.sum() >= 2 and problem.innings]
+    misses = 0
+    while movable and misses < patience * len(movable) and time.time() < deadline:
+        g = movable[int(rng.integers(len(movable)))]
+        matrix, problem = matrices[g], problems[g]
+        column = int(rng.integers(problem.innings))
+        first, second = rng.choice(np.flatnonzero(problem.available), size=2, replace=False)
+        if matrix[first, column] == matrix[second, column]:
+            misses += 1
+            continue
+        matrix[[first, second], column] = matrix[[second, first], column]
+        previous = states[g]
+        states[g] = _GameState(matrix, problem)
+        value = _total(_day_parts(states, problems, groups))
+        if value < best:
+            best = value
+            misses = 0
+        else:
+            if value > best:
+                matrix[[first, second], column] = matrix[[second, first], column]
+                states[g] = previous
+            misses += 1
+    return matrices, best
+
+
+def plan_fielding(problems, time_budget=1.5, seed=None, days=None):
+    """Fielding rotations for a day's games, searched together
+
+    Every Problem must describe the same jerseys and carry the season without any of the day's
+    games. Restarts (construct every game, then improve them jointly) run until the time budget
+    is spent, keeping the best day.
+
+    `days` gives each problem's date key; games on the same date share its pitch limits, which
+    must then be the same on each of those problems. By default every game has its own.
+
+    Returns:
+        tuple: (matrices, parts) with one players x innings matrix per problem and the day's score parts
+    """
+    groups = {}
+    for g, day in enumerate(days if days is not None else range(len(problems))):
+        groups.setdefault(day, []).append(g)
+    groups = list(groups.values())
+    rng = np.random.default_rng(seed)
+    deadline = time.time() + max(float(time_budget), 0.0)
+    best = None
+    while True:
+        matrices, value = _improve(_construct(problems, groups, rng), problems, groups, rng, deadline)
+        if best is None or value < best[0]:
+            best = (value, matrices)
+        if time.time() >= deadline:
+            break
+    matrices = best[1]
+    parts = _day_parts([_GameState(matrix, problem) for matrix, problem in zip(matrices, problems)], problems, groups)
+    parts["total"] = round(_total(parts), 3)
+    return matrices, parts
+
+
+def plan_day(lineup, games, available, can_catch, ledger, stored, batting_counts=None, time_budget=1.5, seed=None,
+             pitching_ledger=None):
+    """Batting orders and fielding rotations for several games on one day in one solve
+
+    Args:
+        lineup (Lineup): Team players and games
+        games (list): Game numbers in play order
+        available, can_catch (ndarray): players x games matrices (see availability_matrix)
+        ledger (FairnessLedger): Season fielding counts, including whatever the day's games have saved
+        stored (dict): {game_number: players x innings matrix as saved}; missing games count as empty
+        batting_counts (ndarray): Season slot counts without the day's games (see batting_engine.slot_counts)
+        time_budget (float): Seconds for the fielding search
+        seed (int): Seed for repeatable plans
+        pitching_ledger (PitchingLedger): Season pitching, including whatever the day's games have
+            saved; when given, each date's pitch limits are shared by its games. Rest needed between
+            two selected dates is not planned for.
+
+    Returns:
+        dict: orders {game_number: [jersey, ...]}, rotations {game_number: {"Inning N": positions}},
+            and summary (the day's fielding score parts)
+    """
+    jerseys = [player.jersey for player in lineup]
+    games = [int(game_number) for game_number in games if lineup.game(game_number) is not None]
+
+    # Take the day's saved games out of the season so the plan replaces them
+    season = ledger
+    for game_number in games:
+        matrix = stored.get(game_number)
+        if matrix is not None:
+            cleared = np.full(matrix.shape, rm.EMPTY, dtype=np.int8)
+            season = season.apply(jerseys, matrix, cleared)
+            if pitching_ledger is not None:
+                pitching_ledger = pitching_ledger.apply(jerseys, lineup.game(game_number).date, matrix, cleared)
+    empty = np.full((len(jerseys), 0), rm.EMPTY, dtype=np.int8)
+    problems = []
+    days = []
+    for game_number in games:
+        game = lineup.game(game_number)
+        pitch_limit = None
+        if pitching_ledger is not None:
+            pitch_limit, _ = pitching_ledger.limits(jerseys, game.date)
+        problems.append(rotation_solver.Problem.from_ledger(
+            season, jerseys, empty, available[:, game.index], can_catch[:, game.index], game.innings, pitch_limit
+        ))
+        # Undated games share the last dated game's day with the ledger
+        day = pitching_ledger.day_of(game.date) if pitching_ledger is not None else pitching.day_number(game.date)
+        days.append(("game", game_number) if day is None else day)
+
+    orders = batting_engine.plan_day(lineup, available, games, batting_counts)
+    if not problems:
+        return {"orders": orders, "rotations": {}, "summary": {}}
+    matrices, summary = plan_fielding(problems, time_budget, seed, days)
+    rotations = {game_number: rm.decode(matrix, jerseys) for game_number, matrix in zip(games, matrices)}
+    return {"orders": orders, "rotations": rotations, "summary": summary}
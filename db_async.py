@@ -0,0 +1,177 @@
+import asyncio
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode
+
+import database
+import db_operations as db
+import query_stats
+
+# Sync URL scheme -> asyncio driver
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+_DRIVER_MODULES = {"postgresql+asyncpg": "asyncpg", "sqlite+aiosqlite": "aiosqlite"}
+# libpq (psycopg2) URL parameters asyncpg takes under another name; any other
+# parameter on a PostgreSQL URL keeps page loads on the sync path
+ASYNCPG_PARAMS = {"sslmode": "ssl", "ssl": "ssl"}
+
+# One event loop on a background thread serves every Streamlit session, so pooled
+# connections stay bound to the loop that opened them
+_loop = None
+_loop_lock = threading.Lock()
+
+# Async URL -> session factory (primary and, when configured, read replica)
+_session_factories = {}
+_available = {}
+
+
+def async_url(url):
+    """Map a sync database URL to its asyncio driver, or None when there isn't one
+
+    On PostgreSQL, sslmode becomes asyncpg's ssl argument (which takes the same modes);
+    a URL with any other query parameter gets None, as asyncpg would reject it.
+    """
+    if not url:
+        return None
+    scheme, separator, rest = url.partition("://")
+    driver = ASYNC_DRIVERS.get(scheme.split("+")[0])
+    # Every aiosqlite connection would get its own empty in-memory database
+    if driver is None or not separator or ":memory:" in rest or rest in ("", "/"):
+        return None
+    if driver == "postgresql+asyncpg" and "?" in rest:
+        rest, _, query = rest.partition("?")
+        params = parse_qsl(query, keep_blank_values=True)
+        if any(name not in ASYNCPG_PARAMS for name, _ in params):
+            return None
+        if params:
+            rest += "?" + urlencode([(ASYNCPG_PARAMS[name], value) for name, value in params])
+    return f"{driver}://{rest}"
+
+def available():
+    """Check whether concurrent loading can be used for the configured database
+
+    Needs an async driver (asyncpg for PostgreSQL, aiosqlite for SQLite) and greenlet.
+    On by default for PostgreSQL, where the queries wait on the network; a local SQLite
+    file has no wait to overlap, so it needs LINEUP_ASYNC_DB=1. LINEUP_ASYNC_DB=0 turns it off.
+    """
+    setting = os.getenv("LINEUP_ASYNC_DB")
+    if setting == "0":
+        return False
+    urls = [database.DATABASE_URL] + ([database.DATABASE_READ_URL] if database.DATABASE_READ_URL else [])
+    for url in map(async_url, urls):
+        if url is None or (url.startswith("sqlite") and setting != "1"):
+            return False
+        if url not in _available:
+            try:
+                import greenlet  # noqa: F401
+                from sqlalchemy.ext.asyncio import create_async_engine  # noqa: F401
+                __import__(_DRIVER_MODULES[url.split("://")[0]])
+                _available[url] = True
+            except ImportError:
+                _available[url] = False
+        if not _available[url]:
+            return False
+    return True
+
+def _get_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="lineup-db-async", daemon=True).start()
+            _loop = loop
+    return _loop
+
+def _get_session_factory(url):
+    """Create the async engine for a URL on first use"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    if url not in _session_factories:
+        engine = create_async_engine(url)
+        query_stats.install(engine.sync_engine)
+        _session_factories[url] = async_sessionmaker(engine, expire_on_commit=False)
+    return _session_factories[url]
+
+
+async def _load_one(session_factory, name, team_id):
+    # Sessions aren't safe to share between tasks, so each read gets its own
+    statement, shape = db.READS[name]
+    async with session_factory() as session:
+        return shape(await session.execute(statement(team_id)))
+
+async def load_team_data_async(team_id, names, scopes=None, url=None):
+    """Run the named db_operations.READS queries for a team concurrently
+
+    Queries go where database.read_database_url() routes the team's reads unless `url` is given.
+
+    Returns:
+        dict: Data name -> the value the matching db_operations getter returns
+    """
+    if scopes is not None:
+        # Report statements to the caller's query_stats scopes from this thread
+        query_stats.adopt(scopes)
+    session_factory = _get_session_factory(url or async_url(database.read_database_url(team_id)))
+    names = list(names)
+    values = await asyncio.gather(*(_load_one(session_factory, name, team_id) for name in names))
+    return dict(zip(names, values))
+
+def load_team_data(team_id, names):
+    """Sync facade for Streamlit code: load several reads concurrently and wait for all of them
+
+    The page waits roughly as long as the slowest query instead of the sum of all of them.
+    """
+    names = list(names)
+    if not names:
+        return {}
+    # Pick the database once so the whole page reads from the same one
+    url = async_url(database.read_database_url(team_id))
+    future = asyncio.run_coroutine_threadsafe(
+        load_team_data_async(team_id, names, query_stats.active_scopes(), url), _get_loop()
+    )
+    return future.result()
+
+
+def benchmark(team_id, repeat=10):
+    """Compare sequential sync reads of every READS entry with one concurrent async load
+
+    Returns:
+        dict: Median milliseconds for "sequential" and "concurrent"
+    """
+    names = list(db.READS)
+    sequential = []
+    concurrent = []
+    load_team_data(team_id, names)  # Warm up the pool
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for name in names:
+            db._read(name, team_id)
+        sequential.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        load_team_data(team_id, names)
+        concurrent.append((time.perf_counter() - started) * 1000)
+    sequential.sort()
+    concurrent.sort()
+    return {"sequential": sequential[len(sequential) // 2], "concurrent": concurrent[len(concurrent) // 2]}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare sequential and concurrent page reads for a team")
+    parser.add_argument("team_id", type=int)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    database.configure(args.database_url)
+    if not available():
+        raise SystemExit("Async loading needs greenlet and asyncpg (PostgreSQL) or aiosqlite "
+                         "(SQLite file, with LINEUP_ASYNC_DB=1)")
+    result = benchmark(args.team_id, args.repeat)
+    print(f"Sequential reads: {result['sequential']:.1f} ms")
+    print(f"Concurrent reads: {result['concurrent']:.1f} ms")
@@ -1,13 +1,31 @@
 import pandas as pd
-from sqlalchemy import desc, and_, func
+from sqlalchemy import desc, and_, func, select
 from sqlalchemy.orm.exc import NoResultFound
 
 from database import (
-    get_db_session, Team, Player, Game, BattingOrder, 
+    get_db_session, get_read_session, Team, Player, Game, BattingOrder, 
     FieldingRotation, PlayerAvailability, 
     roster_df_to_db, roster_db_to_df, 
     schedule_df_to_db, schedule_db_to_df
 )
+import profiling
+import pitching
+import revisions
+import rotation_matrix
+from records import Lineup, ScheduleIndex
+
+# Read queries shared by the getters below and the async loaders in db_async:
+# data name -> (statement builder, result shaper)
+READS = {}
+
+def _read(name, team_id):
+    """Run one of the READS queries for a team on a new session"""
+    statement, shape = READS[name]
+    session = get_read_session(team_id)
+    try:
+        return shape(session.execute(statement(team_id)))
+    finally:
+        session.close()
 
 # Team Operations
 def get_team(team_id):
@@ -52,25 +70,19 @@ def update_team(team_id, team_info):
         team.assistant_coach1 = team_info.get("assistant_coach1", team.assistant_coach1)
         team.assistant_coach2 = team_info.get("assistant_coach2", team.assistant_coach2)
         session.commit()
+        revisions.bump(team_id, "team_info")
     except Exception as e:
         session.rollback()
         raise e
     finally:
         session.close()
 
-def get_team_info(team_id):
-    """Get team info dictionary"""
-    session = get_db_session()
-    try:
-        team = session.query(Team).filter(Team.id == team_id).one()
-        return {
-            "team_name": team.name,
-            "league": team.league,
-            "head_coach": team.head_coach,
-            "assistant_coach1": team.assistant_coach1,
-            "assistant_coach2": team.assistant_coach2
-        }
-    except NoResultFound:
+def _team_info_statement(team_id):
+    return select(Team).where(Team.id == team_id)
+
+def _team_info_from_result(result):
+    team = result.scalars().first()
+    if team is None:
         return {
             "team_name": "",
             "league": "",
@@ -78,18 +90,79 @@ def get_team_info(team_id):
             "assistant_coach1": "",
             "assistant_coach2": ""
         }
+    return {
+        "team_name": team.name,
+        "league": team.league,
+        "head_coach": team.head_coach,
+        "assistant_coach1": team.assistant_coach1,
+        "assistant_coach2": team.assistant_coach2
+    }
+
+def get_team_info(team_id):
+    """Get team info dictionary"""
+    return _read("team_info", team_id)
+
+def _query_team_status(team_id):
+    """Count a team's data with one SELECT of scalar subqueries"""
+    session = get_read_session(team_id)
+    try:
+        players = select(func.count(Player.id)).where(Player.team_id == team_id).scalar_subquery()
+        games = select(func.count(Game.id)).where(Game.team_id == team_id).scalar_subquery()
+        batting_orders = select(func.count(BattingOrder.id)).join(Game).where(Game.team_id == team_id).scalar_subquery()
+        rotation_innings = select(func.count(FieldingRotation.id)).join(Game).where(Game.team_id == team_id).scalar_subquery()
+        availability = select(func.count(PlayerAvailability.id)).join(Game).where(Game.team_id == team_id).scalar_subquery()
+        
+        row = session.execute(
+            select(
+                Team.name,
+                players.label("players"),
+                games.label("games"),
+                batting_orders.label("batting_orders"),
+                rotation_innings.label("rotation_innings"),
+                availability.label("availability")
+            ).where(Team.id == team_id)
+        ).first()
+        
+        if row is None:
+            return {"team_name": "", "players": 0, "games": 0, "batting_orders": 0, "rotation_innings": 0, "availability": 0}
+        return {
+            "team_name": row.name,
+            "players": row.players,
+            "games": row.games,
+            "batting_orders": row.batting_orders,
+            "rotation_innings": row.rotation_innings,
+            "availability": row.availability
+        }
     finally:
         session.close()
 
+# Latest status per team, tagged with the team revision it was computed at
+_team_status_cache = {}
+
+def team_status(team_id):
+    """Get team name and data counts (players, games, orders, rotation innings, availability rows)
+
+    Results are cached until the team's revision changes.
+    """
+    revision = revisions.get(team_id)
+    cached = _team_status_cache.get(team_id)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+    
+    status = _query_team_status(team_id)
+    _team_status_cache[team_id] = (revision, status)
+    return status
+
 # Player Operations
+def _roster_statement(team_id):
+    return select(Player).where(Player.team_id == team_id)
+
+def _roster_from_result(result):
+    return roster_db_to_df(result.scalars().all())
+
 def get_roster(team_id):
     """Get team roster as dataframe"""
-    session = get_db_session()
-    try:
-        players = session.query(Player).filter(Player.team_id == team_id).all()
-        return roster_db_to_df(players)
-    finally:
-        session.close()
+    return _read("roster", team_id)
 
 def update_roster(team_id, roster_df):
     """Update team roster from dataframe"""
@@ -144,11 +217,13 @@ def update_roster(team_id, roster_df):
             session.delete(player)
         
         session.commit()
+        revisions.bump(team_id, "roster", "availability")
         
         # Update jersey references in batting orders and fielding rotations
         if jersey_changes:
             _update_jersey_references(session, team_id, jersey_changes)
             session.commit()
+            revisions.bump(team_id, "batting_orders", "fielding_rotations", "availability")
             
     except Exception as e:
         session.rollback()
@@ -189,16 +264,53 @@ def _update_jersey_references(session, team_id, jersey_changes):
             if updated:
                 rotation.positions = positions
 
-# Game Operations
-def get_schedule(team_id):
-    """Get team schedule as dataframe"""
-    session = get_db_session()
+def get_lineup(team_id):
+    """Get the team's players and games as a records.Lineup (no DataFrames)"""
+    session = get_read_session(team_id)
     try:
-        games = session.query(Game).filter(Game.team_id == team_id).order_by(Game.game_number).all()
-        return schedule_db_to_df(games)
+        player_rows = session.execute(
+            select(Player.first_name, Player.last_name, Player.jersey_number).where(Player.team_id == team_id)
+        ).all()
+        game_rows = session.execute(
+            select(Game.game_number, Game.date, Game.time, Game.opponent, Game.innings)
+            .where(Game.team_id == team_id).order_by(Game.game_number)
+        ).all()
+        return Lineup.from_rows(player_rows, game_rows)
     finally:
         session.close()
 
+# Game Operations
+def _schedule_statement(team_id):
+    return select(Game).where(Game.team_id == team_id).order_by(Game.game_number)
+
+def _schedule_from_result(result):
+    return schedule_db_to_df(result.scalars().all())
+
+def get_schedule(team_id):
+    """Get team schedule as dataframe"""
+    return _read("schedule", team_id)
+
+# Latest schedule index per team, tagged with the schedule revision it was built at
+_schedule_index_cache = {}
+
+def get_schedule_index(team_id, schedule_df=None):
+    """Get a ScheduleIndex of the team's games, rebuilt only when the schedule revision changes
+    
+    Pass the stored schedule DataFrame when the page already has it, so a rebuild doesn't
+    query again. It is only read on a rebuild: the cache is keyed on the revision alone, so
+    pass the schedule as loaded, never one edited in the page.
+    """
+    revision = revisions.get(team_id, "schedule")
+    cached = _schedule_index_cache.get(team_id)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+    
+    if schedule_df is None:
+        schedule_df = get_schedule(team_id)
+    index = ScheduleIndex.from_dataframe(schedule_df)
+    _schedule_index_cache[team_id] = (revision, index)
+    return index
+
 def update_schedule(team_id, schedule_df):
     """Update team schedule from dataframe"""
     session = get_db_session()
@@ -241,6 +353,7 @@ def update_schedule(team_id, schedule_df):
             session.delete(game)
         
         session.commit()
+        revisions.bump(team_id, "schedule", "batting_orders", "fielding_rotations", "availability")
     except Exception as e:
         session.rollback()
         raise e
@@ -249,7 +362,7 @@ def update_schedule(team_id, schedule_df):
 
 def get_game_by_number(team_id, game_number):
     """Get a game by its game number"""
-    session = get_db_session()
+    session = get_read_session(team_id)
     try:
         game = session.query(Game).filter(
             Game.team_id == team_id,
@@ -262,21 +375,15 @@ def get_game_by_number(team_id, game_number):
         session.close()
 
 # Batting Order Operations
+def _batting_orders_statement(team_id):
+    return select(BattingOrder.order_data, Game.game_number).join(Game).where(Game.team_id == team_id)
+
+def _batting_orders_from_result(result):
+    return {game_number: order_data for order_data, game_number in result}
+
 def get_batting_orders(team_id):
     """Get all batting orders for team as dictionary {game_number: order_list}"""
-    session = get_db_session()
-    try:
-        result = {}
-        batting_orders = session.query(BattingOrder, Game.game_number).join(Game).filter(
-            Game.team_id == team_id
-        ).all()
-        
-        for batting_order, game_number in batting_orders:
-            result[game_number] = batting_order.order_data
-            
-        return result
-    finally:
-        session.close()
+    return _read("batting_orders", team_id)
 
 def update_batting_order(team_id, game_number, batting_order):
     """Update batting order for a game"""
@@ -305,33 +412,62 @@ def update_batting_order(team_id, game_number, batting_order):
             session.add(new_order)
             
         session.commit()
+        revisions.bump(team_id, "batting_orders")
     except Exception as e:
         session.rollback()
         raise e
     finally:
         session.close()
 
-# Fielding Rotation Operations
-def get_fielding_rotations(team_id):
-    """Get all fielding rotations for team as nested dictionary {game_number: {inning_key: positions}}"""
+def update_batting_orders(team_id, orders):
+    """Save batting orders for several games in one bulk upsert
+    
+    orders is a dictionary {game_number: [jersey, ...]}; games not on the team are skipped.
+    
+    Returns:
+        int: Number of games written
+    """
     session = get_db_session()
     try:
-        result = {}
-        rotations = session.query(FieldingRotation, Game.game_number).join(Game).filter(
-            Game.team_id == team_id
-        ).all()
-        
-        for rotation, game_number in rotations:
-            if game_number not in result:
-                result[game_number] = {}
-                
-            inning_key = f"Inning {rotation.inning}"
-            result[game_number][inning_key] = rotation.positions
-            
-        return result
+        game_ids = dict(session.execute(
+            select(Game.game_number, Game.id).where(Game.team_id == team_id)
+        ).all())
+        rows = [
+            {"game_id": game_ids[int(game_number)], "order_data": [str(jersey) for jersey in order]}
+            for game_number, order in orders.items() if int(game_number) in game_ids
+        ]
+        if rows:
+            _upsert(session, BattingOrder, rows, ["game_id"], ["order_data"])
+        session.commit()
+        revisions.bump(team_id, "batting_orders")
+        return len(rows)
+    except Exception as e:
+        session.rollback()
+        raise e
     finally:
         session.close()
 
+# Fielding Rotation Operations
+def _fielding_rotations_statement(team_id):
+    return select(FieldingRotation.inning, FieldingRotation.positions, Game.game_number).join(Game).where(
+        Game.team_id == team_id
+    )
+
+def _fielding_rotations_from_result(result):
+    rotations = {}
+    for inning, positions, game_number in result:
+        if game_number not in rotations:
+            rotations[game_number] = {}
+            
+        inning_key = f"Inning {inning}"
+        rotations[game_number][inning_key] = positions
+        
+    return rotations
+
+def get_fielding_rotations(team_id):
+    """Get all fielding rotations for team as nested dictionary {game_number: {inning_key: positions}}"""
+    return _read("fielding_rotations", team_id)
+
 def update_fielding_rotation(team_id, game_number, inning, positions):
     """Update fielding rotation for a game inning"""
     session = get_db_session()
@@ -361,41 +497,70 @@ def update_fielding_rotation(team_id, game_number, inning, positions):
             session.add(new_rotation)
             
         session.commit()
+        revisions.bump(team_id, "fielding_rotations")
     except Exception as e:
         session.rollback()
         raise e
     finally:
         session.close()
 
-# Player Availability Operations
-def get_player_availability(team_id):
-    """Get player availability for all games as nested dictionary {game_number: {key: {jersey: value}}}"""
+def update_fielding_rotations(team_id, rotations):
+    """Save whole games' fielding rotations in one bulk upsert
+
+    rotations is a dictionary {game_number: {"Inning N": positions}}; games not on the team are skipped.
+
+    Returns:
+        int: Number of innings written
+    """
     session = get_db_session()
     try:
-        result = {}
-        
-        # Join PlayerAvailability, Game, and Player to get all data
-        availability_data = session.query(
-            PlayerAvailability, Game.game_number, Player.jersey_number
-        ).join(Game).join(Player).filter(
-            Game.team_id == team_id
-        ).all()
-        
-        for availability, game_number, jersey in availability_data:
-            if game_number not in result:
-                result[game_number] = {
-                    "Available": {},
-                    "Can Play Catcher": {}
-                }
-                
-            # Add availability and catcher info
-            result[game_number]["Available"][jersey] = availability.available
-            result[game_number]["Can Play Catcher"][jersey] = availability.can_play_catcher
-            
-        return result
+        game_ids = dict(session.execute(
+            select(Game.game_number, Game.id).where(Game.team_id == team_id)
+        ).all())
+        rows = [
+            {"game_id": game_ids[int(game_number)], "inning": number, "positions": positions}
+            for game_number, rotation in rotations.items() if int(game_number) in game_ids
+            for number, positions in (
+                (rotation_matrix.inning_number(key), positions) for key, positions in rotation.items()
+            ) if number is not None
+        ]
+        if rows:
+            _upsert(session, FieldingRotation, rows, ["game_id", "inning"], ["positions"])
+        session.commit()
+        revisions.bump(team_id, "fielding_rotations")
+        return len(rows)
+    except Exception as e:
+        session.rollback()
+        raise e
     finally:
         session.close()
 
+# Player Availability Operations
+def _availability_statement(team_id):
+    # Join PlayerAvailability, Game, and Player to get all data
+    return select(
+        PlayerAvailability.available, PlayerAvailability.can_play_catcher, Game.game_number, Player.jersey_number
+    ).select_from(PlayerAvailability).join(Game).join(Player).where(Game.team_id == team_id)
+
+def _availability_from_result(result):
+    availability = {}
+    for available, can_play_catcher, game_number, jersey in result:
+        if game_number not in availability:
+            availability[game_number] = {
+                "Available": {},
+                "Can Play Catcher": {}
+            }
+            
+        # Add availability and catcher info
+        availability[game_number]["Available"][jersey] = available
+        availability[game_number]["Can Play Catcher"][jersey] = can_play_catcher
+        
+    return availability
+
+def get_player_availability(team_id):
+    """Get player availability for all games as nested dictionary {game_number: {key: {jersey: value}}}"""
+    return _read("availability", team_id)
+
 def update_player_availability(team_id, game_number, availability_data):
     """Update player availability for a game
     
@@ -405,143 +570,201 @@ def update_player_availability(team_id, game_number, availability_data):
         "Can Play Catcher": {jersey: boolean, ...}
     }
     """
+    cells = [
+        (jersey, game_number, is_available, availability_data["Can Play Catcher"].get(jersey, False))
+        for jersey, is_available in availability_data["Available"].items()
+    ]
+    update_availability_cells(team_id, cells, require_game=game_number)
+
+def update_availability_cells(team_id, cells, require_game=None):
+    """Save availability for any number of (player, game) cells in one bulk upsert
+    
+    cells is a list of (jersey, game_number, available, can_play_catcher) tuples; cells whose
+    jersey or game isn't on the team are skipped. With require_game, raises NoResultFound when
+    that game doesn't exist, like the single-game save always has.
+    
+    Returns:
+        int: Number of cells written
+    """
     session = get_db_session()
     try:
-        # Get the game
-        game = session.query(Game).filter(
-            Game.team_id == team_id,
-            Game.game_number == game_number
-        ).one()
-        
-        # Get all players for this team with jersey mapping
-        players = session.query(Player).filter(Player.team_id == team_id).all()
-        jersey_to_player = {p.jersey_number: p for p in players}
-        
-        # Process availability data
-        for jersey, is_available in availability_data["Available"].items():
-            if jersey in jersey_to_player:
-                player = jersey_to_player[jersey]
-                can_play_catcher = availability_data["Can Play Catcher"].get(jersey, False)
-                
-                # Check if there's an existing record
-                existing = session.query(PlayerAvailability).filter(
-                    PlayerAvailability.game_id == game.id,
-                    PlayerAvailability.player_id == player.id
-                ).first()
-                
-                if existing:
-                    # Update existing
-                    existing.available = is_available
-                    existing.can_play_catcher = can_play_catcher
-                else:
-                    # Create new
-                    new_availability = PlayerAvailability(
-                        game_id=game.id,
-                        player_id=player.id,
-                        available=is_available,
-                        can_play_catcher=can_play_catcher
-                    )
-                    session.add(new_availability)
+        player_ids = dict(session.execute(
+            select(Player.jersey_number, Player.id).where(Player.team_id == team_id)
+        ).all())
+        game_ids = dict(session.execute(
+            select(Game.game_number, Game.id).where(Game.team_id == team_id)
+        ).all())
+        if require_game is not None and int(require_game) not in game_ids:
+            raise NoResultFound(f"Game {require_game} not found")
+        
+        rows = {}
+        for jersey, game_number, available, can_play_catcher in cells:
+            player_id = player_ids.get(str(jersey))
+            game_id = game_ids.get(int(game_number))
+            if player_id is not None and game_id is not None:
+                rows[(game_id, player_id)] = {
+                    "game_id": game_id,
+                    "player_id": player_id,
+                    "available": bool(available),
+                    "can_play_catcher": bool(can_play_catcher)
+                }
         
+        if rows:
+            _upsert(session, PlayerAvailability, list(rows.values()),
+                    ["game_id", "player_id"], ["available", "can_play_catcher"])
         session.commit()
+        revisions.bump(team_id, "availability")
+        return len(rows)
     except Exception as e:
         session.rollback()
         raise e
     finally:
         session.close()
 
+def _upsert(session, model, rows, keys, fields):
+    """Insert rows, or update `fields` of rows that already exist, in one statement
+    
+    `keys` are the columns of a unique constraint on the model. PostgreSQL and SQLite use
+    INSERT ... ON CONFLICT; other databases update the existing rows and insert the rest.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        dialect_insert = None
+    
+    if dialect_insert is not None:
+        statement = dialect_insert(model)
+        session.execute(statement.on_conflict_do_update(
+            index_elements=[getattr(model, key) for key in keys],
+            set_={field: getattr(statement.excluded, field) for field in fields}
+        ), rows)
+        return
+    
+    first_key = getattr(model, keys[0])
+    existing = {
+        tuple(getattr(record, key) for key in keys): record
+        for record in session.query(model).filter(first_key.in_({row[keys[0]] for row in rows}))
+    }
+    for row in rows:
+        record = existing.get(tuple(row[key] for key in keys))
+        if record is None:
+            session.add(model(**row))
+        else:
+            for field in fields:
+                setattr(record, field, row[field])
+
+READS.update({
+    "team_info": (_team_info_statement, _team_info_from_result),
+    "roster": (_roster_statement, _roster_from_result),
+    "schedule": (_schedule_statement, _schedule_from_result),
+    "batting_orders": (_batting_orders_statement, _batting_orders_from_result),
+    "fielding_rotations": (_fielding_rotations_statement, _fielding_rotations_from_result),
+    "availability": (_availability_statement, _availability_from_result),
+})
+
 # Analytical Operations
+@profiling.profile()
 def analyze_batting_fairness(team_id):
     """Analyze the fairness of batting orders across all games"""
-    session = get_db_session()
+    session = get_read_session(team_id)
     try:
-        # Get the team's players
-        players = session.query(Player).filter(Player.team_id == team_id).all()
-        
-        # Create a mapping from jersey number to player name for easier lookup
-        jersey_to_player = {}
-        for player in players:
-            jersey = player.jersey_number
-            player_name = f"{player.first_name} {player.last_name} (#{jersey})"
-            jersey_to_player[jersey] = player_name
-        
-        # Initialize counters
-        num_players = len(players)
-        player_names = [p.full_name() for p in players]
-        batting_counts = pd.DataFrame(0, index=player_names, columns=range(1, num_players + 1))
+        # Get the team's players, indexed by jersey
+        lineup = Lineup.from_rows(session.execute(
+            select(Player.first_name, Player.last_name, Player.jersey_number).where(Player.team_id == team_id)
+        ).all())
+        num_players = len(lineup)
         
         # Get all batting orders
-        batting_orders = session.query(BattingOrder, Game.game_number).join(Game).filter(
-            Game.team_id == team_id
-        ).all()
+        batting_orders = session.execute(_batting_orders_statement(team_id)).all()
         
         # Count the batting positions for each player across all games
-        for batting_order, game_number in batting_orders:
-            for i, jersey in enumerate(batting_order.order_data, 1):
-                if i <= len(batting_counts.columns) and jersey in jersey_to_player:
-                    player = jersey_to_player[jersey]
-                    batting_counts.loc[player, i] += 1
-        
-        return batting_counts
+        counts = [[0] * num_players for _ in range(num_players)]
+        for order_data, game_number in batting_orders:
+            for slot, jersey in enumerate(order_data or [], 1):
+                index = lineup.index_of(jersey)
+                if slot <= num_players and index is not None:
+                    counts[index][slot - 1] += 1
+        
+        return pd.DataFrame(counts, index=lineup.labels(), columns=range(1, num_players + 1))
     finally:
         session.close()
 
+def _load_season_matrix(session, team_id):
+    """Load the team's players and every stored rotation as a games x players x innings tensor
+    
+    One query for the rotations, skipping innings past each game's length.
+    
+    Returns:
+        tuple: (lineup, season, game_numbers) with season[g] holding game game_numbers[g]
+    """
+    # Get the team's players, indexed by jersey
+    lineup = Lineup.from_rows(session.execute(
+        select(Player.first_name, Player.last_name, Player.jersey_number).where(Player.team_id == team_id)
+    ).all())
+    
+    rotations = {}
+    max_innings = 0
+    for inning, positions, game_number in session.execute(
+        _fielding_rotations_statement(team_id).where(FieldingRotation.inning <= Game.innings)
+    ):
+        if positions:
+            rotations.setdefault(game_number, {})[f"Inning {inning}"] = positions
+            max_innings = max(max_innings, inning)
+    
+    season, game_numbers = rotation_matrix.encode_season(rotations, [player.jersey for player in lineup], max_innings)
+    return lineup, season, game_numbers
+
+@profiling.profile()
 def analyze_fielding_fairness(team_id):
     """Analyze the fairness of fielding positions across all games"""
-    session = get_db_session()
+    session = get_read_session(team_id)
     try:
-        # Get the team's players
-        players = session.query(Player).filter(Player.team_id == team_id).all()
-        
-        # Create a mapping from jersey number to player name for easier lookup
-        jersey_to_player = {}
-        for player in players:
-            jersey = player.jersey_number
-            player_name = f"{player.first_name} {player.last_name} (#{jersey})"
-            jersey_to_player[jersey] = player_name
+        lineup, season, _ = _load_season_matrix(session, team_id)
         
-        # Constants for position categories
-        INFIELD = ["Pitcher", "1B", "2B", "3B", "SS"]
-        OUTFIELD = ["Catcher", "LF", "RF", "LC", "RC"]
-        BENCH = ["Bench"]
-        
-        # Initialize counters for infield, outfield, and bench positions
-        player_names = [p.full_name() for p in players]
-        position_counts = pd.DataFrame(0, index=player_names, columns=["Infield", "Outfield", "Bench", "Total Innings"])
-        
-        # Get all games for this team
-        games = session.query(Game).filter(Game.team_id == team_id).all()
-        
-        # Get all fielding rotations
-        for game in games:
-            # Get innings for this game
-            innings = game.innings
-            
-            # Get fielding rotations for this game
-            rotations = session.query(FieldingRotation).filter(
-                FieldingRotation.game_id == game.id
-            ).all()
-            
-            # Process each inning's rotation
-            for rotation in rotations:
-                if rotation.inning <= innings and rotation.positions:
-                    # Process each player's position
-                    for jersey, position in rotation.positions.items():
-                        if jersey in jersey_to_player:
-                            player = jersey_to_player[jersey]
-                            position_counts.loc[player, "Total Innings"] += 1
-                            
-                            if position in INFIELD:
-                                position_counts.loc[player, "Infield"] += 1
-                            elif position in OUTFIELD:
-                                position_counts.loc[player, "Outfield"] += 1
-                            elif position in BENCH:
-                                position_counts.loc[player, "Bench"] += 1
-        
-        # Calculate percentages
-        for col in ["Infield", "Outfield", "Bench"]:
-            position_counts[f"{col} %"] = (position_counts[col] / position_counts["Total Innings"] * 100).round(1)
-            
-        return position_counts
+        # Innings per category, total innings and percentages for each player over the season
+        return rotation_matrix.fairness_table(season, lineup.labels(), ["Infield", "Outfield", "Bench"])
+    finally:
+        session.close()
+
+# Season fielding ledger per team, tagged with the roster and rotation revisions it was built at
+_fairness_ledger_cache = {}
+
+def get_fairness_ledger(team_id):
+    """Get the team's season FairnessLedger, rebuilt only when its roster or rotations change"""
+    revision = (revisions.get(team_id, "roster"), revisions.get(team_id, "fielding_rotations"))
+    cached = _fairness_ledger_cache.get(team_id)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+    
+    session = get_read_session(team_id)
+    try:
+        lineup, season, _ = _load_season_matrix(session, team_id)
+    finally:
+        session.close()
+    ledger = rotation_matrix.FairnessLedger.from_season(season, [player.jersey for player in lineup])
+    _fairness_ledger_cache[team_id] = (revision, ledger)
+    return ledger
+
+# Season pitching ledger per team, tagged with the roster, schedule and rotation revisions it was built at
+_pitching_ledger_cache = {}
+
+def get_pitching_ledger(team_id):
+    """Get the team's PitchingLedger, rebuilt only when its roster, schedule or rotations change"""
+    revision = tuple(revisions.get(team_id, scope) for scope in ("roster", "schedule", "fielding_rotations"))
+    cached = _pitching_ledger_cache.get(team_id)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+    
+    session = get_read_session(team_id)
+    try:
+        lineup, season, game_numbers = _load_season_matrix(session, team_id)
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+    schedule_index = get_schedule_index(team_id)
+    dates = [schedule_index.game(number).date if number in schedule_index else None for number in game_numbers]
+    ledger = pitching.PitchingLedger.from_season(season, dates, [player.jersey for player in lineup])
+    _pitching_ledger_cache[team_id] = (revision, ledger)
+    return ledger
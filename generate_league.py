@@ -0,0 +1,265 @@
+import random
+import time
+import uuid
+from datetime import date, time as dtime, timedelta
+
+from sqlalchemy import insert
+
+import database
+from database import User, Team, Player, Game, BattingOrder, FieldingRotation, PlayerAvailability
+
+# Same field positions as lineup.POSITIONS, without importing the Streamlit app
+FIELD_POSITIONS = ["Pitcher", "Catcher", "1B", "2B", "3B", "SS", "LF", "RF", "LC", "RC"]
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Casey", "Riley", "Jamie", "Morgan", "Avery", "Quinn",
+               "Drew", "Parker", "Reese", "Rowan", "Skyler", "Emerson", "Hayden", "Jesse", "Logan", "Kai"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Martinez", "Lopez",
+              "Wilson", "Anderson", "Thomas", "Moore", "Jackson", "Martin", "Lee", "Clark", "Lewis", "Young"]
+TEAM_NAMES = ["Tigers", "Cubs", "Hawks", "Sharks", "Comets", "Rockets", "Bears", "Eagles", "Pirates", "Giants"]
+
+# Teams generated and committed per transaction
+DEFAULT_CHUNK_TEAMS = 100
+
+
+def _insert_returning(session, model, rows, *columns):
+    """Bulk insert rows and return the requested columns in parameter order"""
+    if not rows:
+        return []
+    return session.execute(
+        insert(model).returning(*columns, sort_by_parameter_order=True), rows
+    ).all()
+
+def _make_users(session, count, run_id, password):
+    rows = []
+    for n in range(count):
+        # Reuse the model's hashing so synthetic users can log in
+        user = User(email=f"coach{n + 1}-{run_id}@example.com")
+        user.set_password(password)
+        rows.append({"email": user.email, "password_hash": user.password_hash, "salt": user.salt})
+    return [user_id for (user_id,) in _insert_returning(session, User, rows, User.id)]
+
+def _make_schedule(rng, games, innings, season_start):
+    schedule = []
+    for game_number in range(1, games + 1):
+        schedule.append({
+            "game_number": game_number,
+            "date": season_start + timedelta(days=3 * (game_number - 1)),
+            "time": dtime(hour=rng.choice([9, 11, 13, 17, 18])),
+            "opponent": f"{rng.choice(TEAM_NAMES)} {rng.randint(1, 99)}",
+            "innings": innings
+        })
+    return schedule
+
+def _rotation_for_game(rng, available, catchers, innings, game_number):
+    """Rotate available players through the field, one inning at a time"""
+    rotations = []
+    if not available:
+        return rotations
+    offset = game_number % len(available)
+    for inning in range(1, innings + 1):
+        start = (offset + inning - 1) % len(available)
+        order = available[start:] + available[:start]
+        positions = {}
+        # Put a catcher-capable player behind the plate when there is one
+        catcher = next((jersey for jersey in order if jersey in catchers), None)
+        field = [position for position in FIELD_POSITIONS if position != "Catcher"]
+        if catcher is not None:
+            positions[catcher] = "Catcher"
+            order = [jersey for jersey in order if jersey != catcher]
+        else:
+            field = FIELD_POSITIONS
+        for i, jersey in enumerate(order):
+            positions[jersey] = field[i] if i < len(field) else "Bench"
+        rotations.append((inning, positions))
+    return rotations
+
+def _generate_teams(session, rng, user_ids, teams_per_user, roster_size, games, innings,
+                    availability_density, catcher_share, season_start):
+    """Insert one chunk of fully populated teams and return row counts"""
+    counts = {"teams": 0, "players": 0, "games": 0, "availability": 0, "batting_orders": 0, "fielding_rotations": 0}
+
+    team_rows = []
+    for user_id in user_ids:
+        for n in range(teams_per_user):
+            team_rows.append({
+                "name": f"{rng.choice(TEAM_NAMES)} {user_id}-{n + 1}",
+                "league": rng.choice(["Minors", "Majors", "Rookie"]),
+                "head_coach": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "assistant_coach1": "",
+                "assistant_coach2": "",
+                "user_id": user_id
+            })
+    team_ids = [team_id for (team_id,) in _insert_returning(session, Team, team_rows, Team.id)]
+    counts["teams"] = len(team_ids)
+
+    player_rows = []
+    for team_id in team_ids:
+        jerseys = rng.sample(range(0, 100), roster_size)
+        # update_roster matches players by name, so names must be unique within a team
+        names = rng.sample(range(len(FIRST_NAMES) * len(LAST_NAMES)), roster_size)
+        for jersey, name in zip(jerseys, names):
+            player_rows.append({
+                "team_id": team_id,
+                "first_name": FIRST_NAMES[name // len(LAST_NAMES)],
+                "last_name": LAST_NAMES[name % len(LAST_NAMES)],
+                "jersey_number": str(jersey)
+            })
+    players = _insert_returning(session, Player, player_rows, Player.id, Player.team_id, Player.jersey_number)
+    counts["players"] = len(players)
+
+    roster = {team_id: [] for team_id in team_ids}
+    for player_id, team_id, jersey in players:
+        roster[team_id].append((player_id, jersey))
+
+    game_rows = []
+    for team_id in team_ids:
+        for game in _make_schedule(rng, games, innings, season_start):
+            game_rows.append({"team_id": team_id, **game})
+    game_ids = _insert_returning(session, Game, game_rows, Game.id, Game.team_id, Game.game_number)
+    counts["games"] = len(game_ids)
+
+    availability_rows = []
+    batting_rows = []
+    rotation_rows = []
+    for game_id, team_id, game_number in game_ids:
+        available = []
+        catchers = set()
+        for player_id, jersey in roster[team_id]:
+            is_available = rng.random() < availability_density
+            can_catch = rng.random() < catcher_share
+            availability_rows.append({
+                "game_id": game_id,
+                "player_id": player_id,
+                "available": is_available,
+                "can_play_catcher": can_catch
+            })
+            if is_available:
+                available.append(jersey)
+                if can_catch:
+                    catchers.add(jersey)
+
+        # Shift the batting order each game so every player leads off eventually
+        start = game_number % len(available) if available else 0
+        batting_rows.append({"game_id": game_id, "order_data": available[start:] + available[:start]})
+
+        unavailable = [jersey for _, jersey in roster[team_id] if jersey not in available]
+        for inning, positions in _rotation_for_game(rng, available, catchers, innings, game_number):
+            for jersey in unavailable:
+                positions[jersey] = "OUT"
+            rotation_rows.append({"game_id": game_id, "inning": inning, "positions": positions})
+
+    if availability_rows:
+        session.execute(insert(PlayerAvailability), availability_rows)
+    if batting_rows:
+        session.execute(insert(BattingOrder), batting_rows)
+    if rotation_rows:
+        session.execute(insert(FieldingRotation), rotation_rows)
+    counts["availability"] = len(availability_rows)
+    counts["batting_orders"] = len(batting_rows)
+    counts["fielding_rotations"] = len(rotation_rows)
+    return team_ids, counts
+
+def generate_league(users=10, teams_per_user=2, roster_size=12, games=20, innings=6,
+                    availability_density=0.9, catcher_share=0.25, seed=None,
+                    password="password", chunk_teams=DEFAULT_CHUNK_TEAMS, progress=None):
+    """Populate the configured database with synthetic users and fully planned seasons
+
+    Args:
+        users (int): Users to create
+        teams_per_user (int): Teams owned by each user
+        roster_size (int): Players per team (at most 100, jerseys are 0-99)
+        games (int): Games per season
+        innings (int): Innings per game
+        availability_density (float): Chance that a player is available for a game
+        catcher_share (float): Chance that a player can catch in a game
+        seed (int): Random seed for reproducible data
+        password (str): Password of every generated user
+        chunk_teams (int): Teams inserted per transaction
+        progress (callable): Called with the running counts after each chunk
+
+    Returns:
+        dict: Row counts per table, the generated user and team IDs and elapsed seconds
+    """
+    if not 1 <= roster_size <= 100:
+        raise ValueError("roster_size must be between 1 and 100")
+
+    rng = random.Random(seed)
+    # Keeps emails unique when the generator runs more than once against a database
+    run_id = uuid.uuid4().hex[:8]
+    season_start = date.today().replace(month=4, day=1)
+
+    started = time.perf_counter()
+    totals = {"users": 0, "teams": 0, "players": 0, "games": 0, "availability": 0,
+              "batting_orders": 0, "fielding_rotations": 0}
+    all_user_ids = []
+    all_team_ids = []
+
+    session = database.get_db_session()
+    try:
+        user_ids = _make_users(session, users, run_id, password)
+        session.commit()
+        totals["users"] = len(user_ids)
+        all_user_ids.extend(user_ids)
+
+        users_per_chunk = max(1, chunk_teams // max(1, teams_per_user))
+        for i in range(0, len(user_ids), users_per_chunk):
+            team_ids, counts = _generate_teams(
+                session, rng, user_ids[i:i + users_per_chunk], teams_per_user, roster_size, games, innings,
+                availability_density, catcher_share, season_start
+            )
+            session.commit()
+            all_team_ids.extend(team_ids)
+            for name, count in counts.items():
+                totals[name] += count
+            if progress:
+                progress(dict(totals))
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    return {**totals, "user_ids": all_user_ids, "team_ids": all_team_ids,
+            "seconds": time.perf_counter() - started}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Populate a database with synthetic league data")
+    parser.add_argument("--database-url", default="sqlite:///lineup_synthetic.db",
+                        help="Target database (defaults to a local SQLite file; DATABASE_URL is never used)")
+    parser.add_argument("--yes", action="store_true",
+                        help="Confirm writing synthetic users and teams to a database that isn't SQLite")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--teams-per-user", type=int, default=2)
+    parser.add_argument("--roster-size", type=int, default=12)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--innings", type=int, default=6)
+    parser.add_argument("--availability", type=float, default=0.9, help="Chance a player is available for a game")
+    parser.add_argument("--catcher-share", type=float, default=0.25, help="Chance a player can catch in a game")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--chunk-teams", type=int, default=DEFAULT_CHUNK_TEAMS, help="Teams per transaction")
+    args = parser.parse_args()
+
+    # A server database may be shared or live, so only write to one on purpose
+    if not args.database_url.startswith("sqlite") and not args.yes:
+        parser.error(f"{args.database_url} is not a SQLite database; pass --yes to write synthetic data to it")
+
+    database.configure(args.database_url)
+    database.create_tables()
+
+    def report(totals):
+        print(f"{totals['teams']} teams, {totals['players']} players, {totals['games']} games, "
+              f"{totals['fielding_rotations']} rotation innings")
+
+    result = generate_league(
+        users=args.users, teams_per_user=args.teams_per_user, roster_size=args.roster_size,
+        games=args.games, innings=args.innings, availability_density=args.availability,
+        catcher_share=args.catcher_share, seed=args.seed, password=args.password,
+        chunk_teams=args.chunk_teams, progress=report
+    )
+    rows = sum(result[name] for name in ("users", "teams", "players", "games", "availability",
+                                         "batting_orders", "fielding_rotations"))
+    print(f"Inserted {rows} rows in {result['seconds']:.1f}s ({rows / max(result['seconds'], 1e-9):.0f} rows/s)")
@@ -0,0 +1,448 @@
+import os
+import time
+from datetime import date, time as dt_time
+
+import pandas as pd
+from sqlalchemy import insert, update
+
+from database import get_db_session, Team, Player, Game
+from db_operations import _update_jersey_references
+import revisions
+
+ROSTER_COLUMNS = ["Team", "First Name", "Last Name", "Jersey Number"]
+SCHEDULE_COLUMNS = ["Team", "Game #", "Date", "Time", "Opponent", "Innings"]
+REQUIRED_SCHEDULE_COLUMNS = ["Team", "Game #"]
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+# Readers
+def iter_chunks(file, filename, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield DataFrame chunks of a CSV or Excel file without loading it whole
+
+    Args:
+        file: Path or file-like object
+        filename (str): Used to pick the reader from the extension
+        chunk_size (int): Rows per chunk
+
+    Yields:
+        pandas.DataFrame: String-typed chunk with a "Row" column holding file row numbers;
+            an empty file or one with only a header yields nothing
+    """
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension in (".xlsx", ".xlsm"):
+        yield from _iter_excel_chunks(file, chunk_size)
+        return
+
+    # Row numbers as seen in a spreadsheet (header is row 1)
+    first_row = 2
+    try:
+        chunks = pd.read_csv(file, chunksize=chunk_size, dtype=str, skipinitialspace=True)
+    except pd.errors.EmptyDataError:
+        return
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        chunk.columns = [str(col).strip() for col in chunk.columns]
+        chunk.insert(0, "Row", range(first_row, first_row + len(chunk)))
+        first_row += len(chunk)
+        yield chunk
+
+def _iter_excel_chunks(file, chunk_size):
+    """Stream the first worksheet of an Excel workbook in chunks"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError("Excel import requires openpyxl. Run: pip install openpyxl")
+
+    # read_only mode streams rows instead of building the whole sheet
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(col).strip() if col is not None else "" for col in next(rows, [])]
+
+        buffer = []
+        row_number = 1
+        for values in rows:
+            row_number += 1
+            if all(value is None for value in values):
+                continue
+            record = {"Row": row_number}
+            for col, value in zip(header, values):
+                record[col] = None if value is None else str(value)
+            buffer.append(record)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer)
+    finally:
+        workbook.close()
+
+
+# Row validation
+def _clean(value):
+    """Normalize a raw cell value to a stripped string or None"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    value = str(value).strip()
+    return value or None
+
+def _parse_temporal(value, fast_parser, convert):
+    """Parse a date or time, trying ISO format before pandas' slower inference"""
+    try:
+        return fast_parser(value)
+    except ValueError:
+        pass
+    parsed = pd.to_datetime(value, errors="coerce")
+    if pd.isna(parsed):
+        return None
+    return convert(parsed)
+
+class RosterRowValidator:
+    """Validate roster rows incrementally, remembering jerseys and players seen per team"""
+
+    def __init__(self):
+        self.seen_jerseys = {}
+        # (team, first name, last name) -> jersey of the player's first row
+        self.seen_players = {}
+
+    def check_columns(self, columns):
+        missing = [col for col in ROSTER_COLUMNS if col not in columns]
+        if missing:
+            return f"Roster must contain columns: {', '.join(missing)}"
+        return None
+
+    def validate(self, row):
+        """Return (record, error) for one row"""
+        team = _clean(row.get("Team"))
+        first_name = _clean(row.get("First Name"))
+        last_name = _clean(row.get("Last Name"))
+        jersey = _clean(row.get("Jersey Number"))
+
+        if not all([team, first_name, last_name, jersey]):
+            return None, "Roster row contains missing values"
+
+        # Excel hands back numbers like "7.0"
+        if jersey.endswith(".0") and jersey[:-2].isdigit():
+            jersey = jersey[:-2]
+
+        team_jerseys = self.seen_jerseys.setdefault(team, set())
+        if jersey in team_jerseys:
+            return None, f"Duplicate jersey number {jersey} for team {team}"
+        first_jersey = self.seen_players.get((team, first_name, last_name))
+        if first_jersey is not None:
+            return None, f"{first_name} {last_name} is listed again for team {team}, with jersey {jersey} after {first_jersey}"
+        team_jerseys.add(jersey)
+        self.seen_players[(team, first_name, last_name)] = jersey
+
+        return {"team": team, "first_name": first_name, "last_name": last_name, "jersey_number": jersey}, None
+
+class ScheduleRowValidator:
+    """Validate schedule rows incrementally, remembering game numbers seen per team"""
+
+    def __init__(self):
+        self.seen_games = {}
+
+    def check_columns(self, columns):
+        missing = [col for col in REQUIRED_SCHEDULE_COLUMNS if col not in columns]
+        if missing:
+            return f"Schedule must contain columns: {', '.join(missing)}"
+        return None
+
+    def validate(self, row):
+        """Return (record, error) for one row"""
+        team = _clean(row.get("Team"))
+        if not team:
+            return None, "Schedule row is missing a team"
+
+        try:
+            game_number = int(float(_clean(row.get("Game #"))))
+        except (TypeError, ValueError):
+            return None, "Game # must be a number"
+
+        team_games = self.seen_games.setdefault(team, set())
+        if game_number in team_games:
+            return None, f"Duplicate game {game_number} for team {team}"
+        team_games.add(game_number)
+
+        raw_date = _clean(row.get("Date"))
+        game_date = None
+        if raw_date:
+            game_date = _parse_temporal(raw_date, date.fromisoformat, lambda parsed: parsed.date())
+            if game_date is None:
+                return None, f"Invalid date '{raw_date}'"
+
+        raw_time = _clean(row.get("Time"))
+        game_time = None
+        if raw_time:
+            game_time = _parse_temporal(raw_time, dt_time.fromisoformat, lambda parsed: parsed.time())
+            if game_time is None:
+                return None, f"Invalid time '{raw_time}'"
+
+        raw_innings = _clean(row.get("Innings"))
+        try:
+            innings = int(float(raw_innings)) if raw_innings else 6
+        except ValueError:
+            return None, f"Invalid innings '{raw_innings}'"
+        if not 1 <= innings <= 9:
+            return None, "Innings must be between 1 and 9"
+
+        return {
+            "team": team,
+            "game_number": game_number,
+            "date": game_date,
+            "time": game_time,
+            "opponent": _clean(row.get("Opponent")) or "",
+            "innings": innings
+        }, None
+
+
+# Writers
+class TeamResolver:
+    """Map team names to IDs for a user, creating missing teams in bulk
+
+    Sees the same teams as get_teams_for_user: the user's own and those without an owner.
+    When both have a name, the user's own team wins.
+    """
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.team_ids = None
+
+    def resolve(self, session, team_names):
+        if self.team_ids is None:
+            teams = session.query(Team.id, Team.name, Team.user_id).filter(
+                (Team.user_id == self.user_id) | (Team.user_id == None)
+            ).all()
+            # Unowned teams first so the user's own overwrite them
+            self.team_ids = {name: team_id for team_id, name, owner in sorted(teams, key=lambda t: t[2] is not None)}
+
+        missing = [name for name in team_names if name not in self.team_ids]
+        if missing:
+            created = session.execute(
+                insert(Team).returning(Team.id, Team.name),
+                [{"name": name, "league": "", "head_coach": "", "assistant_coach1": "",
+                  "assistant_coach2": "", "user_id": self.user_id} for name in missing]
+            ).all()
+            for team_id, name in created:
+                self.team_ids[name] = team_id
+        return {name: self.team_ids[name] for name in team_names}
+
+    def reset(self):
+        """Forget cached IDs after a rollback so the map is reloaded from the database"""
+        self.team_ids = None
+
+def _write_roster_chunk(session, resolver, records):
+    """Upsert a chunk of roster records grouped by team in the current transaction
+
+    Rows giving a player a jersey another player of the team keeps are rejected; a jersey
+    counts as free when its holder gets a new one in an accepted row of the same chunk.
+    """
+    team_ids = resolver.resolve(session, sorted({r["team"] for r in records}))
+
+    # One query for the existing players of every team in the chunk
+    existing = {}
+    holders = {}
+    for player in session.query(Player.id, Player.team_id, Player.first_name, Player.last_name, Player.jersey_number).filter(
+        Player.team_id.in_(team_ids.values())
+    ):
+        existing[(player.team_id, player.first_name, player.last_name)] = player
+        holders[(player.team_id, player.jersey_number)] = (player.first_name, player.last_name)
+
+    # Reject rows taking a kept jersey until no more are rejected: a rejected row no longer
+    # frees its player's old jersey, which can reject the row that wanted it
+    rejected = {}
+    while True:
+        moving = set()
+        for record in records:
+            key = (team_ids[record["team"]], record["first_name"], record["last_name"])
+            match = existing.get(key)
+            if record["row"] not in rejected and match is not None and match.jersey_number != record["jersey_number"]:
+                moving.add(key)
+        newly_rejected = False
+        for record in records:
+            if record["row"] in rejected:
+                continue
+            team_id = team_ids[record["team"]]
+            holder = holders.get((team_id, record["jersey_number"]))
+            if (holder is not None and holder != (record["first_name"], record["last_name"])
+                    and (team_id,) + holder not in moving):
+                rejected[record["row"]] = (f"Jersey number {record['jersey_number']} already belongs to "
+                                           f"{holder[0]} {holder[1]} on team {record['team']}")
+                newly_rejected = True
+        if not newly_rejected:
+            break
+
+    inserts = []
+    updates = []
+    errors = sorted(rejected.items())
+    jersey_changes = {}
+    for record in records:
+        if record["row"] in rejected:
+            continue
+        team_id = team_ids[record["team"]]
+        match = existing.get((team_id, record["first_name"], record["last_name"]))
+        if match is None:
+            inserts.append({
+                "team_id": team_id,
+                "first_name": record["first_name"],
+                "last_name": record["last_name"],
+                "jersey_number": record["jersey_number"]
+            })
+        elif match.jersey_number != record["jersey_number"]:
+            updates.append({"id": match.id, "jersey_number": record["jersey_number"]})
+            jersey_changes.setdefault(team_id, {})[match.jersey_number] = record["jersey_number"]
+
+    if inserts:
+        session.execute(insert(Player), inserts)
+    if updates:
+        session.execute(update(Player), updates)
+
+    # Keep batting orders and rotations pointing at the new jerseys
+    for team_id, changes in jersey_changes.items():
+        _update_jersey_references(session, team_id, changes)
+
+    touched = {team_id: ("roster", "batting_orders", "fielding_rotations", "availability") for team_id in team_ids.values()}
+    return len(inserts), len(updates), touched, errors
+
+def _write_schedule_chunk(session, resolver, records):
+    """Upsert a chunk of schedule records grouped by team in the current transaction"""
+    team_ids = resolver.resolve(session, sorted({r["team"] for r in records}))
+
+    # One query for the existing games of every team in the chunk
+    existing = {
+        (game.team_id, game.game_number): game.id
+        for game in session.query(Game.id, Game.team_id, Game.game_number).filter(
+            Game.team_id.in_(team_ids.values())
+        )
+    }
+
+    inserts = []
+    updates = []
+    for record in records:
+        team_id = team_ids[record["team"]]
+        values = {
+            "date": record["date"],
+            "time": record["time"],
+            "opponent": record["opponent"],
+            "innings": record["innings"]
+        }
+        game_id = existing.get((team_id, record["game_number"]))
+        if game_id is None:
+            inserts.append({"team_id": team_id, "game_number": record["game_number"], **values})
+        else:
+            updates.append({"id": game_id, **values})
+
+    if inserts:
+        session.execute(insert(Game), inserts)
+    if updates:
+        session.execute(update(Game), updates)
+
+    touched = {team_id: ("schedule",) for team_id in team_ids.values()}
+    return len(inserts), len(updates), touched, []
+
+
+# Pipeline
+def _run_import(file, filename, user_id, validator, writer, chunk_size):
+    """Validate and write a file chunk by chunk, yielding one report per chunk
+
+    A file without data rows yields a single report saying so.
+    """
+    resolver = TeamResolver(user_id)
+
+    chunk_number = 0
+    for chunk_number, chunk in enumerate(iter_chunks(file, filename, chunk_size), 1):
+        started = time.perf_counter()
+        errors = []
+
+        if chunk_number == 1:
+            column_error = validator.check_columns(chunk.columns)
+            if column_error:
+                yield {
+                    "chunk": chunk_number, "rows": len(chunk), "inserted": 0, "updated": 0,
+                    "rejected": len(chunk), "seconds": 0.0, "rows_per_second": 0.0,
+                    "errors": [(None, column_error)]
+                }
+                return
+
+        records = []
+        for row in chunk.to_dict("records"):
+            record, error = validator.validate(row)
+            if error:
+                errors.append((row["Row"], error))
+            else:
+                record["row"] = row["Row"]
+                records.append(record)
+
+        inserted = updated = 0
+        if records:
+            session = get_db_session()
+            try:
+                inserted, updated, touched, write_errors = writer(session, resolver, records)
+                session.commit()
+                errors.extend(write_errors)
+                rejected_rows = {row for row, _ in write_errors}
+                records = [record for record in records if record["row"] not in rejected_rows]
+                for team_id, scopes in touched.items():
+                    revisions.bump(team_id, *scopes)
+            except Exception as e:
+                session.rollback()
+                resolver.reset()
+                errors.append((None, f"Chunk {chunk_number} failed and was rolled back: {str(e)}"))
+                records = []
+                inserted = updated = 0
+            finally:
+                session.close()
+
+        seconds = time.perf_counter() - started
+        yield {
+            "chunk": chunk_number,
+            "rows": len(chunk),
+            "inserted": inserted,
+            "updated": updated,
+            "rejected": len(chunk) - len(records),
+            "seconds": seconds,
+            "rows_per_second": len(chunk) / seconds if seconds > 0 else 0.0,
+            "errors": errors
+        }
+
+    if chunk_number == 0:
+        yield {
+            "chunk": 0, "rows": 0, "inserted": 0, "updated": 0, "rejected": 0,
+            "seconds": 0.0, "rows_per_second": 0.0, "errors": [(None, "The file contains no rows")]
+        }
+
+def import_rosters(file, filename, user_id, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Import a league-wide roster file (Team, First Name, Last Name, Jersey Number)
+
+    Players are matched to existing ones by team and name; matches get their jersey
+    updated and everyone else is inserted. Players missing from the file are kept.
+    Each chunk is written in its own transaction.
+
+    Yields:
+        dict: Per-chunk report with row counts, timing, throughput and errors
+    """
+    return _run_import(file, filename, user_id, RosterRowValidator(), _write_roster_chunk, chunk_size)
+
+def import_schedules(file, filename, user_id, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Import a league-wide schedule file (Team, Game #, Date, Time, Opponent, Innings)
+
+    Games are matched by team and game number; matches are updated and the rest
+    inserted. Games missing from the file are kept. Each chunk is written in its
+    own transaction.
+
+    Yields:
+        dict: Per-chunk report with row counts, timing, throughput and errors
+    """
+    return _run_import(file, filename, user_id, ScheduleRowValidator(), _write_schedule_chunk, chunk_size)
+
+def summarize_reports(reports):
+    """Combine per-chunk reports into totals"""
+    totals = {"chunks": 0, "rows": 0, "inserted": 0, "updated": 0, "rejected": 0, "seconds": 0.0}
+    for report in reports:
+        totals["chunks"] += 1
+        for key in ("rows", "inserted", "updated", "rejected", "seconds"):
+            totals[key] += report[key]
+    totals["rows_per_second"] = totals["rows"] / totals["seconds"] if totals["seconds"] > 0 else 0.0
+    return totals
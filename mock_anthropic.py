@@ -0,0 +1,323 @@
+import json
+import logging
+import random
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Offline stand-in for the Anthropic messages endpoint used by lineup.generate_fielding_rotation.
+# Point the app at it with ANTHROPIC_BASE_URL=http://127.0.0.1:8765 and any ANTHROPIC_API_KEY.
+
+FIELD_POSITIONS = ["Pitcher", "Catcher", "1B", "2B", "3B", "SS", "LF", "RF", "LC", "RC"]
+INFIELD = ["Pitcher", "1B", "2B", "3B", "SS"]
+OUTFIELD = ["Catcher", "LF", "RF", "LC", "RC"]
+
+# Response shapes generate_fielding_rotation has to handle
+SCENARIOS = ["plan", "invalid_plan", "malformed_json", "no_json", "empty_content",
+             "bad_structure", "server_error", "rate_limit", "overloaded"]
+
+
+def _extract_data(prompt):
+    """Pull the team data JSON embedded in the rotation prompt"""
+    start = prompt.find("{", prompt.find("Here is the data:"))
+    if start < 0:
+        return {}
+    try:
+        data, _ = json.JSONDecoder().raw_decode(prompt[start:])
+    except json.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def build_plan(data):
+    """Build a rotation for the players in the request that passes the client's validation
+
+    Field slots alternate infield and outfield and every player moves one slot per inning,
+    so nobody repeats a position or plays infield (or outfield) in consecutive innings.
+    Catcher eligibility is not considered.
+    """
+    players = data.get("players", [])
+    innings = int(data.get("game_info", {}).get("innings", 6))
+    available = [p["jersey"] for p in players if p.get("available", True)]
+    slots = [position for pair in zip(INFIELD, OUTFIELD) for position in pair]
+    slots += ["Bench"] * max(0, len(available) - len(slots))
+
+    plan = {}
+    stats = {jersey: {"infield": 0, "outfield": 0, "bench": 0, "total": 0} for jersey in available}
+    for inning in range(1, innings + 1):
+        positions = {p["jersey"]: "OUT" for p in players if not p.get("available", True)}
+        for i, jersey in enumerate(available):
+            position = slots[(i + inning - 1) % len(slots)]
+            positions[jersey] = position
+            kind = "bench" if position == "Bench" else "infield" if position in INFIELD else "outfield"
+            stats[jersey][kind] += 1
+            stats[jersey]["total"] += 1
+        plan[f"Inning {inning}"] = positions
+    return {"fielding_plan": plan, "statistics": stats, "reasoning": "Mock rotation: players move one slot per inning."}
+
+def _message(text):
+    return {
+        "id": "msg_mock",
+        "type": "message",
+        "role": "assistant",
+        "model": "mock",
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "usage": {"input_tokens": 0, "output_tokens": 0}
+    }
+
+def scenario_response(scenario, request_body):
+    """Return (status, headers, body) for a built-in scenario"""
+    prompt = ""
+    for message in request_body.get("messages", []):
+        if isinstance(message.get("content"), str):
+            prompt = message["content"]
+
+    if scenario == "plan":
+        return 200, {}, _message(json.dumps(build_plan(_extract_data(prompt))))
+    if scenario == "invalid_plan":
+        # Drop the pitcher from the first inning so the plan fails validation
+        result = build_plan(_extract_data(prompt))
+        first = result["fielding_plan"].get("Inning 1", {})
+        for jersey, position in first.items():
+            if position == "Pitcher":
+                first[jersey] = "Bench"
+        return 200, {}, _message("Here is the plan:\n" + json.dumps(result))
+    if scenario == "malformed_json":
+        return 200, {}, _message('{"fielding_plan": {"Inning 1": {"12": "Pitcher",}')
+    if scenario == "no_json":
+        return 200, {}, _message("I'm sorry, I can't produce a rotation for this roster.")
+    if scenario == "empty_content":
+        return 200, {}, {**_message(""), "content": []}
+    if scenario == "bad_structure":
+        return 200, {}, {"type": "message", "completion": "unexpected"}
+    if scenario == "rate_limit":
+        return 429, {"retry-after": "1"}, {"type": "error", "error": {"type": "rate_limit_error", "message": "Rate limited"}}
+    if scenario == "overloaded":
+        return 529, {}, {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}
+    return 500, {}, {"type": "error", "error": {"type": "api_error", "message": "Internal server error"}}
+
+
+class MockConfig:
+    """What the mock server returns and how slowly
+
+    Args:
+        mix (dict): Scenario name -> weight, e.g. {"plan": 0.9, "rate_limit": 0.1}
+        latency_ms (float): Mean added latency per request
+        jitter_ms (float): Standard deviation of the added latency
+        recordings (list): Recorded responses ({"status", "body", "headers", "latency_ms"}) replayed
+            in order before falling back to `mix`; a recorded latency_ms replaces the configured latency
+        seed (int): Random seed for scenario choice and latency
+    """
+
+    def __init__(self, mix=None, latency_ms=0.0, jitter_ms=0.0, recordings=None, seed=None):
+        self.mix = mix or {"plan": 1.0}
+        unknown = set(self.mix) - set(SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.recordings = list(recordings or [])
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.served = {}
+
+    def next_response(self, request_body):
+        with self.lock:
+            if self.recordings:
+                recorded = self.recordings.pop(0)
+                latency = recorded.get("latency_ms", self.latency_ms)
+                response = (recorded.get("status", 200), recorded.get("headers", {}), recorded["body"])
+                name = "recorded"
+            else:
+                names = list(self.mix)
+                name = self.rng.choices(names, weights=[self.mix[n] for n in names])[0]
+                latency = max(0.0, self.rng.gauss(self.latency_ms, self.jitter_ms)) if self.jitter_ms else self.latency_ms
+                response = None
+            self.served[name] = self.served.get(name, 0) + 1
+        if response is None:
+            response = scenario_response(name, request_body)
+        return latency, response
+
+def load_recordings(path):
+    """Read recorded responses, one JSON object per line"""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def _make_handler(config):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("content-length", 0))
+            try:
+                request_body = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                request_body = {}
+
+            if self.path.rstrip("/") != "/v1/messages":
+                status, headers, body = 404, {}, {"type": "error", "error": {"type": "not_found_error", "message": self.path}}
+                latency = 0.0
+            else:
+                latency, (status, headers, body) = config.next_response(request_body)
+
+            if latency:
+                time.sleep(latency / 1000)
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def start_server(config=None, host="127.0.0.1", port=0):
+    """Start the mock server on a background thread and return (server, base_url)"""
+    config = config or MockConfig()
+    server = ThreadingHTTPServer((host, port), _make_handler(config))
+    server.daemon_threads = True
+    server.config = config
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def sample_request_data(num_players=12, innings=6, catchers=3, unavailable=1):
+    """Rotation request data shaped like lineup.prepare_data_for_claude output"""
+    players = []
+    for n in range(num_players):
+        players.append({
+            "name": f"Player {n + 1}",
+            "jersey": str(n + 1),
+            "available": n >= unavailable,
+            "can_play_catcher": unavailable <= n < unavailable + catchers
+        })
+    positions = FIELD_POSITIONS + ["Bench"]
+    return {
+        "players": players,
+        "game_info": {"game_id": 1, "opponent": "Mock Opponent", "innings": innings},
+        "current_positions": {},
+        "previous_rotations": {},
+        "positions": positions,
+        "required_positions": FIELD_POSITIONS,
+        "stats": {
+            "total_players": num_players,
+            "available_players": num_players - unavailable,
+            "available_catchers": catchers
+        },
+        "position_categories": {
+            "infield": INFIELD,
+            "outfield": OUTFIELD,
+            "bench": ["Bench"]
+        }
+    }
+
+def benchmark(requests_count=50, concurrency=4, config=None, data=None, max_retries=3):
+    """Drive lineup.generate_fielding_rotation against the mock server and report client throughput
+
+    Each request retries failures up to `max_retries` attempts, like add_claude_rotation_generator.
+
+    Returns:
+        dict: requests, attempts, seconds, requests_per_second, p50_ms, p95_ms, final status codes
+            and how many successful results carried a validation warning
+    """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Import the Streamlit app in bare mode without its missing-runtime warnings
+    logging.disable(logging.WARNING)
+    try:
+        import lineup
+    finally:
+        logging.disable(logging.NOTSET)
+
+    server, base_url = start_server(config)
+    previous = {name: os.environ.get(name) for name in ("ANTHROPIC_BASE_URL", "ANTHROPIC_API_KEY")}
+    os.environ["ANTHROPIC_BASE_URL"] = base_url
+    os.environ.setdefault("ANTHROPIC_API_KEY", "mock-key")
+    data = data or sample_request_data()
+
+    def call():
+        started = time.perf_counter()
+        for attempt in range(1, max_retries + 1):
+            result, status = lineup.generate_fielding_rotation(data)
+            if status == 200:
+                break
+        return (time.perf_counter() - started) * 1000, status, "validation_warning" in result, attempt
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(lambda _: call(), range(requests_count)))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    latencies = sorted(outcome[0] for outcome in outcomes)
+    statuses = {}
+    for _, status, _, _ in outcomes:
+        statuses[status] = statuses.get(status, 0) + 1
+    return {
+        "requests": requests_count,
+        "attempts": sum(outcome[3] for outcome in outcomes),
+        "seconds": elapsed,
+        "requests_per_second": requests_count / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "statuses": statuses,
+        "validation_warnings": sum(1 for _, status, warned, _ in outcomes if status == 200 and warned),
+        "served": dict(server.config.served)
+    }
+
+
+def _parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Offline mock of the Anthropic messages API for rotation generation")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--mix", default="plan=1",
+                        help=f"Weighted scenarios, e.g. plan=0.8,rate_limit=0.1,malformed_json=0.1 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--recordings", help="JSON lines of recorded responses to replay first")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Send N rotation requests through the client and exit")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        mix=_parse_mix(args.mix), latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        recordings=load_recordings(args.recordings) if args.recordings else None, seed=args.seed
+    )
+
+    if args.benchmark:
+        result = benchmark(args.benchmark, args.concurrency, config)
+        print(f"{result['requests']} requests ({result['attempts']} attempts) in {result['seconds']:.2f}s "
+              f"({result['requests_per_second']:.1f} req/s, concurrency {args.concurrency})")
+        print(f"Latency p50 {result['p50_ms']:.1f} ms, p95 {result['p95_ms']:.1f} ms")
+        print(f"Status codes: {result['statuses']}; validation warnings: {result['validation_warnings']}")
+        print(f"Served: {result['served']}")
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", args.port), _make_handler(config))
+        print(f"Mock Anthropic API on http://127.0.0.1:{args.port} (set ANTHROPIC_BASE_URL to this)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+# Default byte budget for rendered PDFs kept in memory (32 MB)
+DEFAULT_BYTE_BUDGET = 32 * 1024 * 1024
+# Revision keys remembered per cache; each only points at a content hash
+MAX_ALIASES = 4096
+
+
+def game_content_hash(game_data, template_version):
+    """Hash the inputs of a game plan so identical lineups share a cache entry
+
+    Args:
+        game_data (dict): JSON-serializable game plan inputs (team info, roster,
+            batting order, rotation and availability)
+        template_version (int): Version of the PDF layout, bumped when it changes
+
+    Returns:
+        str: Hex digest identifying the rendered document
+    """
+    payload = json.dumps(
+        {"template_version": template_version, "game": game_data},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RenderCache:
+    """Thread-safe LRU of rendered documents bounded by their total size in bytes"""
+
+    def __init__(self, byte_budget=DEFAULT_BYTE_BUDGET):
+        self.byte_budget = byte_budget
+        self._entries = OrderedDict()
+        # Cheap keys (e.g. team revisions) -> content hash, checked before any data is loaded
+        self._aliases = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached bytes for key, or None if not cached"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            # Mark as most recently used
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def get_alias(self, alias):
+        """Return the cached bytes an alias points at, or None if either is gone"""
+        with self._lock:
+            key = self._aliases.get(alias)
+            data = None if key is None else self._entries.get(key)
+            if data is None:
+                return None
+            self._aliases.move_to_end(alias)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put_alias(self, alias, key):
+        """Point an alias at a content key, forgetting the oldest aliases past MAX_ALIASES"""
+        with self._lock:
+            self._aliases[alias] = key
+            self._aliases.move_to_end(alias)
+            while len(self._aliases) > MAX_ALIASES:
+                self._aliases.popitem(last=False)
+
+    def put(self, key, data):
+        """Store rendered bytes, evicting least recently used entries over budget"""
+        size = len(data)
+        if size > self.byte_budget:
+            # Never cache a document that would flush everything else
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = data
+            self._size += size
+            while self._size > self.byte_budget:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        """Drop all cached documents"""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._size = 0
+
+    def stats(self):
+        """Return a dictionary describing cache usage"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "byte_budget": self.byte_budget,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+# Process-wide cache so every session viewing the same lineup shares renders
+pdf_cache = RenderCache(int(os.getenv("PDF_CACHE_BYTES", DEFAULT_BYTE_BUDGET)))
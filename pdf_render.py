@@ -0,0 +1,197 @@
+import io
+import threading
+
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+
+# Bump whenever the PDF layout changes so cached renders are invalidated
+TEMPLATE_VERSION = 2
+
+# Position categories shown in the legend (mirrors lineup.py)
+INFIELD = ["Pitcher", "1B", "2B", "3B", "SS"]
+OUTFIELD = ["Catcher", "LF", "RF", "LC", "RC"]
+
+# Fixed column widths
+ORDER_WIDTH = 0.5*inch    # Batting order
+JERSEY_WIDTH = 0.6*inch   # Jersey number
+NAME_WIDTH = 2.0*inch     # Player name
+AVAIL_WIDTH = 0.7*inch    # Availability
+MIN_INNING_WIDTH = 0.5*inch
+
+# Landscape letter width and total left and right margins
+PAGE_WIDTH = 11.0*inch
+MARGINS = 1.0*inch
+
+
+class GamePlanTemplate:
+    """Styles, table style and column widths for the game plan PDF, built once and reused
+
+    The app renders every document with one shared template (see get_template);
+    benchmarks.py compares that with building a new one per document.
+    """
+
+    def __init__(self):
+        styles = getSampleStyleSheet()
+        self.title_style = ParagraphStyle(
+            'Title',
+            parent=styles['Heading1'],
+            fontSize=16,
+            alignment=1,  # Center
+            spaceAfter=6
+        )
+        self.normal_style = ParagraphStyle(
+            'Normal',
+            parent=styles['Normal'],
+            fontSize=9,
+            leading=10
+        )
+        # Left-justified game details text
+        self.details_style = ParagraphStyle(
+            'Details',
+            parent=styles['Normal'],
+            fontSize=10,
+            leading=14,
+            leftIndent=0.2*inch
+        )
+        self.footer_style = ParagraphStyle('Footer', fontSize=7, textColor=colors.gray, alignment=1)
+
+        # Basic table styling without color coding
+        self.table_style = TableStyle([
+            # Header styling
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+
+            # Content styling
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # Center order numbers
+            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Center jersey numbers
+            ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # Center availability
+            ('ALIGN', (4, 0), (-1, -1), 'CENTER'),  # Center positions in innings
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),  # Thicker line below header
+        ])
+
+        # Position legend shown under the table
+        self.legend_text = ("<b>Position Legend:</b> <i>Infield:</i> " + ", ".join(INFIELD) +
+                            " | <i>Outfield:</i> " + ", ".join(OUTFIELD) +
+                            " | <i>Other:</i> Bench, OUT")
+
+    def col_widths(self, innings):
+        """Return the table column widths for a game with the given number of innings"""
+        # Calculate inning width based on available space and number of innings
+        used_width = ORDER_WIDTH + JERSEY_WIDTH + NAME_WIDTH + AVAIL_WIDTH
+        available_width = PAGE_WIDTH - used_width - MARGINS
+
+        # If we can't fit all innings at minimum width, fall back to the minimum
+        max_innings_that_fit = int(available_width / MIN_INNING_WIDTH)
+        if innings > max_innings_that_fit:
+            inning_width = MIN_INNING_WIDTH
+        else:
+            inning_width = available_width / innings
+
+        return [ORDER_WIDTH, JERSEY_WIDTH, NAME_WIDTH, AVAIL_WIDTH] + [inning_width] * innings
+
+    def header_row(self, innings):
+        """Return the table header row for a game with the given number of innings"""
+        return ["Order", "Jersey #", "Player Name", "Available"] + [f"Inning {i}" for i in range(1, innings + 1)]
+
+    def build_elements(self, game_data):
+        """Build the flowables for one game plan page"""
+        game_number = game_data["game_number"]
+        team_info = game_data["team_info"]
+        batting_order = game_data["batting_order"]
+        fielding_data = game_data["fielding"]
+        availability = game_data["availability"]
+        innings = game_data["innings"]
+
+        elements = [Paragraph(f"Game {game_number} Lineup", self.title_style)]
+
+        # Gather game details information
+        asst_coaches = [team_info[key] for key in ("assistant_coach1", "assistant_coach2") if team_info.get(key)]
+        league = team_info.get("league", "")
+
+        # Format each line of details
+        details_text = f"<b>Team:</b> {team_info.get('team_name', '')}<br/>"
+        if league:
+            details_text += f"<b>League:</b> {league}<br/>"
+        details_text += f"<b>Head Coach:</b> {team_info.get('head_coach', '')}<br/>"
+        if asst_coaches:
+            details_text += f"<b>Assistant Coach(es):</b> {', '.join(asst_coaches)}<br/>"
+        details_text += f"<b>Opponent:</b> {game_data['opponent']}<br/>"
+        details_text += f"<b>Date/Time:</b> {game_data['date_time']}<br/>"
+        details_text += f"<b>Innings:</b> {innings}"
+
+        elements.append(Paragraph(details_text, self.details_style))
+        elements.append(Spacer(1, 0.2*inch))
+
+        # Batting positions looked up once instead of list.index per player
+        batting_positions = {}
+        for i, jersey in enumerate(batting_order, 1):
+            batting_positions.setdefault(jersey, i)
+
+        player_data = []
+        for player in game_data["roster"]:
+            jersey = player["jersey"]
+            player_data.append({
+                "Jersey": jersey,
+                "Name": f"{player['first_name']} {player['last_name']}",
+                "Batting": batting_positions.get(jersey, "-"),
+                "Available": "Yes" if availability.get(jersey, True) else "No"
+            })
+
+        # Sort player data by batting order, putting players not in the order at the end
+        player_data.sort(key=lambda x: 999 if x["Batting"] == "-" else x["Batting"])
+
+        inning_positions = [fielding_data.get(f"Inning {inning}") or {} for inning in range(1, innings + 1)]
+
+        table_data = [self.header_row(innings)]
+        for player in player_data:
+            jersey = player["Jersey"]
+            row = [player["Batting"], f"#{jersey}", player["Name"], player["Available"]]
+            row.extend(positions.get(jersey, "-") for positions in inning_positions)
+            table_data.append(row)
+
+        main_table = Table(table_data, colWidths=self.col_widths(innings), repeatRows=1)
+        main_table.setStyle(self.table_style)
+        elements.append(main_table)
+
+        # Legend and footer with small text
+        elements.append(Spacer(1, 0.1*inch))
+        elements.append(Paragraph(self.legend_text, self.normal_style))
+        elements.append(Spacer(1, 0.1*inch))
+        elements.append(Paragraph("LineupBoss - Game Plan", self.footer_style))
+        return elements
+
+    def render(self, game_data):
+        """Render a game plan to PDF bytes"""
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=landscape(letter), leftMargin=0.5*inch, rightMargin=0.5*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+        doc.build(self.build_elements(game_data))
+        return buffer.getvalue()
+
+
+# Shared template used by the app
+_template = None
+_template_lock = threading.Lock()
+
+def get_template():
+    """Return the process-wide game plan template, building it on first use"""
+    global _template
+    if _template is None:
+        with _template_lock:
+            if _template is None:
+                _template = GamePlanTemplate()
+    return _template
+
+def render(game_data):
+    """Render a game plan dictionary (see lineup.collect_game_plan_data) to PDF bytes"""
+    return get_template().render(game_data)
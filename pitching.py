@@ -0,0 +1,230 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import rotation_matrix as rm
+
+def _rest_days(setting):
+    """Parse "4:2,3:1" (innings pitched:days of rest) into REST_DAYS pairs, highest first"""
+    pairs = (part.split(":") for part in setting.split(",") if part.strip())
+    return tuple(sorted(((int(innings), int(days)) for innings, days in pairs), reverse=True))
+
+# League pitching rules, in innings and calendar days. The defaults are placeholders, not any
+# league's rulebook: set the LINEUP_PITCH_* environment variables to your league's limits.
+MAX_DAY_INNINGS = int(os.getenv("LINEUP_PITCH_MAX_DAY_INNINGS", "4"))         # innings one player may pitch on a single day
+WINDOW_DAYS = int(os.getenv("LINEUP_PITCH_WINDOW_DAYS", "7"))                 # length of the rolling window, including the day being checked
+MAX_WINDOW_INNINGS = int(os.getenv("LINEUP_PITCH_MAX_WINDOW_INNINGS", "8"))   # innings one player may pitch within the rolling window
+# (innings pitched on a day, full days of rest needed before pitching again), highest first
+REST_DAYS = _rest_days(os.getenv("LINEUP_PITCH_REST_DAYS", "4:2,3:1"))
+
+_MAX_REST = max((days for _, days in REST_DAYS), default=0)
+# Most innings a player may pitch in a day with their next outing that many days later (index
+# 1.._MAX_REST; index 0, no later outing, is unlimited): one less than the fewest innings whose
+# rest would reach it
+_REST_CAP = [MAX_DAY_INNINGS] + [
+    min((innings for innings, days in REST_DAYS if days >= ahead), default=MAX_DAY_INNINGS + 1) - 1
+    for ahead in range(1, _MAX_REST + 1)
+]
+
+
+def day_number(date):
+    """Calendar day number (proleptic ordinal) of a game date, or None for games without one"""
+    if date is None:
+        return None
+    try:
+        timestamp = pd.Timestamp(date)
+    except (TypeError, ValueError):
+        return None
+    return None if pd.isna(timestamp) else timestamp.toordinal()
+
+def rest_needed(innings):
+    """Full days of rest required after pitching `innings` in one day (works on arrays)"""
+    innings = np.asarray(innings)
+    rest = np.zeros(innings.shape, dtype=np.int32)
+    for threshold, days in reversed(REST_DAYS):
+        rest = np.where(innings >= threshold, days, rest)
+    return rest
+
+def pitched_innings(matrix):
+    """Innings pitched per row of a players x innings matrix"""
+    return (matrix == rm.CODE["Pitcher"]).sum(axis=-1)
+
+
+class PitchingLedger:
+    """Innings pitched per player per calendar day, for rest and workload checks
+
+    Days are columns of one players x days array, so the rolling window and rest lookups for a
+    date read a fixed number of columns whatever the season's length. Built once from the stored
+    season; a game's edits are applied by moving its pitched innings on its day only.
+
+    Games without a date can't be placed, so they count as played on the last dated game's day:
+    their innings add to it and their limits are checked against it. Only when no game has a
+    date does each undated game stand alone with the daily allowance.
+    """
+
+    __slots__ = ("rows", "first_day", "daily", "last_dated")
+
+    def __init__(self, jerseys, first_day, daily, last_dated=None):
+        self.rows = {str(jersey): row for row, jersey in enumerate(jerseys)}
+        self.first_day = first_day
+        # players x days, column 0 being first_day
+        self.daily = daily
+        # Day undated games are counted on, None when the season has no dated games
+        self.last_dated = last_dated
+
+    def day_of(self, date):
+        """Day number a game is counted on: its date's, else the last dated game's (may be None)"""
+        day = day_number(date)
+        return self.last_dated if day is None else day
+
+    @classmethod
+    def from_season(cls, season, dates, jerseys):
+        """Build from a games x players x innings tensor and each game's date (see encode_season)"""
+        days = [day_number(date) for date in dates]
+        known = [g for g, day in enumerate(days) if day is not None]
+        first_day = min((days[g] for g in known), default=0)
+        last_day = max((days[g] for g in known), default=0)
+        last_dated = last_day if known else None
+        daily = np.zeros((len(jerseys), last_day - first_day + 1), dtype=np.int16)
+        if known:
+            days = [last_day if day is None else day for day in days]
+            innings = pitched_innings(season)   # games x players
+            columns = np.array([day - first_day for day in days], dtype=np.intp)
+            np.add.at(daily.T, columns, innings)
+        return cls(jerseys, first_day, daily, last_dated)
+
+    def _window(self, day, length):
+        """players x `length` columns ending at `day`, zero-filled outside the season"""
+        window = np.zeros((self.daily.shape[0], length), dtype=np.int32)
+        start = day - length + 1 - self.first_day
+        lo, hi = max(start, 0), min(start + length, self.daily.shape[1])
+        if lo < hi:
+            window[:, lo - start:hi - start] = self.daily[:, lo:hi]
+        return window
+
+    def limits(self, jerseys, date):
+        """Innings each player may still pitch on `date`
+
+        Zero for players who haven't rested long enough since their last outing; otherwise
+        whatever is left of the day's allowance, of every rolling window that contains the date
+        (including windows reaching into later days), and of what still leaves the rest their
+        next saved outing needs. Jerseys without a ledger row haven't pitched. Games without a
+        date are checked as if played on the last dated game's day; when no game has a date they
+        get the daily allowance only.
+
+        Returns:
+            tuple: (limits, reasons) with an int array and a reason string ("" when unrestricted)
+                per jersey
+        """
+        rows = np.array([self.rows.get(str(jersey), -1) for jersey in jerseys], dtype=np.intp)
+        day = self.day_of(date)
+        if day is None:
+            return np.full(len(rows), MAX_DAY_INNINGS, dtype=np.int32), [""] * len(rows)
+        undated = day_number(date) is None
+
+        # Columns: the same span before and after the date, covering the rest periods and every
+        # rolling window that contains it; column `span` is the date itself
+        span = max(WINDOW_DAYS - 1, _MAX_REST)
+        window = self._window(day + span, 2 * span + 1)
+        window = np.vstack([window, np.zeros((1, 2 * span + 1), dtype=np.int32)])[rows]
+        today = window[:, span]
+
+        # Days since each earlier outing (1 = yesterday) against the rest that outing requires
+        before = window[:, span - _MAX_REST:span]
+        since = np.arange(_MAX_REST, 0, -1)
+        resting = (rest_needed(before) >= since) & (before > 0)
+
+        # The next outing within the longest rest period caps the day's innings at what leaves
+        # enough rest before it
+        after = window[:, span + 1:span + 1 + _MAX_REST] > 0
+        ahead = np.zeros(len(rows), dtype=np.intp)
+        if _MAX_REST:
+            ahead = np.where(after.any(axis=1), after.argmax(axis=1) + 1, 0)
+        rest_cap = np.array([_REST_CAP[days_ahead] for days_ahead in ahead], dtype=np.int32) - today
+
+        # Innings in each WINDOW_DAYS window containing the date, the first ending on it
+        cumulative = np.concatenate([np.zeros((len(rows), 1), dtype=np.int32), window.cumsum(axis=1)], axis=1)
+        ends = np.arange(span + 1, span + WINDOW_DAYS + 1)
+        in_windows = cumulative[:, ends] - cumulative[:, ends - WINDOW_DAYS]
+        busiest = in_windows.argmax(axis=1)
+        in_window = in_windows[np.arange(len(rows)), busiest]
+
+        caps = np.stack([MAX_DAY_INNINGS - today, MAX_WINDOW_INNINGS - in_window, rest_cap], axis=1)
+        binding = caps.argmin(axis=1)
+        limits = np.where(resting.any(axis=1), 0, np.maximum(caps.min(axis=1), 0)).astype(np.int32)
+
+        reasons = []
+        for i in range(len(rows)):
+            if resting[i].any():
+                days_ago = int(since[np.flatnonzero(resting[i])[-1]])
+                innings = int(before[i, np.flatnonzero(resting[i])[-1]])
+                reasons.append(f"pitched {innings} inning(s) {days_ago} day(s) earlier and needs "
+                               f"{int(rest_needed(innings))} day(s) of rest")
+            elif limits[i] >= MAX_DAY_INNINGS:
+                reasons.append("")
+            elif binding[i] == 0:
+                reasons.append(f"already pitched {int(today[i])} inning(s) that day")
+            elif binding[i] == 1 and busiest[i] == 0:
+                reasons.append(f"pitched {int(in_window[i])} inning(s) in the last {WINDOW_DAYS} days")
+            elif binding[i] == 1:
+                reasons.append(f"pitches {int(in_window[i])} inning(s) in the {WINDOW_DAYS} days ending "
+                               f"{int(busiest[i])} day(s) later, counting later games")
+            else:
+                innings = int(window[i, span + ahead[i]])
+                reasons.append(f"pitches {innings} inning(s) {int(ahead[i])} day(s) later and needs the rest "
+                               f"before it")
+        if undated:
+            reasons = [reason and f"{reason} (the game has no date, so it counts as the last dated game's day)"
+                       for reason in reasons]
+        return limits, reasons
+
+    def apply(self, jerseys, date, stored, edited):
+        """Ledger with one game's edits applied on its day
+
+        Args:
+            jerseys (list): Jersey of each matrix row
+            date: The game's date; games without one apply on the last dated game's day, and
+                leave the ledger as it is when no game has a date
+            stored (ndarray): players x innings the ledger was built with
+            edited (ndarray): The same game after the edits
+
+        Returns:
+            PitchingLedger: A new ledger; this one is left unchanged
+        """
+        day = self.day_of(date)
+        change = pitched_innings(edited) - pitched_innings(stored)
+        ledger = PitchingLedger.__new__(PitchingLedger)
+        ledger.rows = self.rows
+        ledger.first_day = self.first_day
+        ledger.daily = self.daily
+        ledger.last_dated = self.last_dated
+        if day is None or not change.any():
+            return ledger
+
+        # Widen the day range when the game falls outside it
+        first_day = min(self.first_day, day)
+        last_day = max(self.first_day + self.daily.shape[1] - 1, day)
+        daily = np.zeros((self.daily.shape[0], last_day - first_day + 1), dtype=np.int16)
+        offset = self.first_day - first_day
+        daily[:, offset:offset + self.daily.shape[1]] = self.daily
+        for row, delta in zip(jerseys, change):
+            row = self.rows.get(str(row))
+            if row is not None and delta:
+                daily[row, day - first_day] += delta
+        ledger.first_day = first_day
+        ledger.daily = daily
+        return ledger
+
+    def check(self, jerseys, date, matrix):
+        """Players pitching more of a game than they're allowed
+
+        `matrix` is players x innings for the game; the ledger must not already count it.
+
+        Returns:
+            list: (row, innings pitched, limit, reason) per player over their limit
+        """
+        limits, reasons = self.limits(jerseys, date)
+        pitched = pitched_innings(matrix)
+        return [(int(row), int(pitched[row]), int(limits[row]), reasons[row])
+                for row in np.flatnonzero(pitched > limits)]
@@ -0,0 +1,173 @@
+import contextvars
+import functools
+import io
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import query_stats
+
+# Most recent invocation records, oldest dropped first
+RING_SIZE = 500
+records = deque(maxlen=RING_SIZE)
+_records_lock = threading.Lock()
+
+# Invocations currently running in this thread or task, innermost last
+_stack = contextvars.ContextVar("profiling_stack", default=())
+
+# Blocks currently inside memory_tracing, and whether tracemalloc was started for them
+_memory_users = 0
+_memory_started = False
+_memory_lock = threading.Lock()
+
+
+class _Invocation:
+    """Mutable timing state of one running profiled block"""
+
+    def __init__(self, name, tags):
+        self.name = name
+        self.tags = tags
+        self.api_seconds = 0.0
+        self.peak_bytes = 0
+
+
+@contextmanager
+def profiled(name, **tags):
+    """Record wall time, DB time, external API time and peak memory of a block
+
+    Peak memory is only measured while tracemalloc is tracing (see memory_tracing).
+    Extra keyword arguments (e.g. players=14) are stored as tags on the record.
+    """
+    invocation = _Invocation(name, tags)
+    parent_stack = _stack.get()
+    token = _stack.set(parent_stack + (invocation,))
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        memory_start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+    started = time.perf_counter()
+    try:
+        with query_stats.collect(name) as db_stats:
+            yield invocation
+    finally:
+        wall_seconds = time.perf_counter() - started
+        _stack.reset(token)
+
+        if tracing and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            # A nested block resets the peak, so fold in what children saw
+            invocation.peak_bytes = max(invocation.peak_bytes, peak - memory_start)
+        if parent_stack:
+            parent = parent_stack[-1]
+            parent.api_seconds += invocation.api_seconds
+            parent.peak_bytes = max(parent.peak_bytes, invocation.peak_bytes)
+
+        record = {
+            "name": name,
+            "at": time.time(),
+            "wall_ms": round(wall_seconds * 1000, 2),
+            "db_ms": round(db_stats.db_seconds * 1000, 2),
+            "db_statements": db_stats.statements,
+            "api_ms": round(invocation.api_seconds * 1000, 2),
+            "peak_kb": round(invocation.peak_bytes / 1024, 1) if tracing else None,
+            **tags
+        }
+        with _records_lock:
+            records.append(record)
+
+def profile(name=None):
+    """Decorator form of profiled(), named after the function by default"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profiled(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def external_call():
+    """Attribute the time spent in the block to external API time of the running invocation"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stack = _stack.get()
+        if stack:
+            stack[-1].api_seconds += time.perf_counter() - started
+
+def recent(limit=50, name=None):
+    """Return the most recent records, newest first, optionally filtered by name"""
+    with _records_lock:
+        items = list(records)
+    items.reverse()
+    if name is not None:
+        items = [record for record in items if record["name"] == name]
+    return items[:limit]
+
+@contextmanager
+def memory_tracing():
+    """Run tracemalloc for the block so profiled sections inside it report peak memory
+
+    Tracing adds a lot of overhead, so it stops when the last block using it ends, unless
+    something else had already started it.
+    """
+    global _memory_users, _memory_started
+    with _memory_lock:
+        if _memory_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _memory_started = True
+        _memory_users += 1
+    try:
+        yield
+    finally:
+        with _memory_lock:
+            _memory_users -= 1
+            if _memory_users == 0 and _memory_started:
+                tracemalloc.stop()
+                _memory_started = False
+
+
+@contextmanager
+def capture(mode):
+    """Run the block under cProfile or pyinstrument and yield a dict that receives the report
+
+    Args:
+        mode (str): "cprofile" or "pyinstrument"; pyinstrument falls back to cProfile
+            when it isn't installed
+    """
+    result = {"mode": mode, "report": ""}
+
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            mode = result["mode"] = "cprofile"
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield result
+            finally:
+                profiler.stop()
+                result["report"] = profiler.output_text(unicode=True, color=False)
+            return
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(40)
+        result["report"] = output.getvalue()
@@ -0,0 +1,141 @@
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+logger = logging.getLogger("lineup.db")
+
+# Number of slowest statements kept per scope
+SLOWEST_KEPT = 5
+# An identical statement run this many times in one scope is flagged as a likely N+1 loop
+REPEAT_THRESHOLD = 5
+# Longest statement text kept in summaries
+STATEMENT_PREVIEW = 300
+
+# Scopes (rerun, tab, ...) currently collecting for this thread or task
+_active = contextvars.ContextVar("query_stats_active", default=())
+
+# Summaries of recently finished top-level scopes
+recent = deque(maxlen=50)
+_recent_lock = threading.Lock()
+
+
+class QueryCollector:
+    """Statement count, DB time, rows and slowest statements for one scope"""
+
+    def __init__(self, name):
+        self.name = name
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+        self.slowest = []
+        self.statement_counts = Counter()
+        self.children = []
+        self.started = time.perf_counter()
+        self.wall_seconds = None
+
+    def record(self, statement, seconds, rowcount):
+        self.statements += 1
+        self.db_seconds += seconds
+        # Drivers report -1 when they don't know the row count (e.g. SQLite SELECTs)
+        if rowcount is not None and rowcount >= 0:
+            self.rows += rowcount
+        self.statement_counts[statement] += 1
+        self.slowest.append((seconds, statement))
+        if len(self.slowest) > SLOWEST_KEPT:
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+    def summary(self):
+        """Return a JSON-serializable description of the scope"""
+        return {
+            "scope": self.name,
+            "statements": self.statements,
+            "db_ms": round(self.db_seconds * 1000, 2),
+            "wall_ms": round((self.wall_seconds or 0.0) * 1000, 2),
+            "rows": self.rows,
+            "slowest": [
+                {"ms": round(seconds * 1000, 2), "sql": statement[:STATEMENT_PREVIEW]}
+                for seconds, statement in sorted(self.slowest, key=lambda item: item[0], reverse=True)
+            ],
+            "repeated": [
+                {"count": count, "sql": statement[:STATEMENT_PREVIEW]}
+                for statement, count in self.statement_counts.most_common()
+                if count >= REPEAT_THRESHOLD
+            ],
+            "children": [child.summary() for child in self.children]
+        }
+
+
+@contextmanager
+def collect(name):
+    """Collect statistics for every statement executed inside the block
+
+    Scopes nest: a statement is counted in every active scope, and a nested scope
+    is listed under its parent's children. Top-level scopes are logged as JSON to
+    the "lineup.db" logger and kept in `recent`.
+    """
+    collector = QueryCollector(name)
+    active = _active.get()
+    if active:
+        active[-1].children.append(collector)
+    token = _active.set(active + (collector,))
+    try:
+        yield collector
+    finally:
+        _active.reset(token)
+        collector.wall_seconds = time.perf_counter() - collector.started
+        if not active:
+            summary = collector.summary()
+            with _recent_lock:
+                recent.append(summary)
+            logger.info(json.dumps({"event": "db_stats", **summary}))
+
+def current():
+    """Return the innermost active collector, or None"""
+    active = _active.get()
+    return active[-1] if active else None
+
+def active_scopes():
+    """Return the active collectors, to hand to work running on another thread"""
+    return _active.get()
+
+def adopt(scopes):
+    """Report statements of the current context into scopes from active_scopes()"""
+    _active.set(scopes)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_stats_start"].pop()
+    active = _active.get()
+    if not active:
+        return
+    elapsed = time.perf_counter() - started
+    rowcount = getattr(cursor, "rowcount", None)
+    for collector in active:
+        collector.record(statement, elapsed, rowcount)
+
+def _handle_error(exception_context):
+    # Drop the pending start time of a statement that failed
+    conn = exception_context.connection
+    if conn is not None:
+        pending = conn.info.get("query_stats_start")
+        if pending:
+            pending.pop()
+
+def install(engine):
+    """Attach the instrumentation listeners to an engine"""
+    if getattr(engine, "_query_stats_installed", False):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    engine._query_stats_installed = True
@@ -0,0 +1,196 @@
+import pandas as pd
+
+
+class PlayerRec:
+    """One roster entry; `index` is the player's position in its Lineup"""
+
+    __slots__ = ("index", "first_name", "last_name", "jersey")
+
+    def __init__(self, index, first_name, last_name, jersey):
+        self.index = index
+        self.first_name = first_name
+        self.last_name = last_name
+        self.jersey = str(jersey)
+
+    @property
+    def name(self):
+        return f"{self.first_name} {self.last_name}"
+
+    @property
+    def label(self):
+        """Display name used across the app, e.g. "Sam Lee (#12)" """
+        return f"{self.first_name} {self.last_name} (#{self.jersey})"
+
+    def __repr__(self):
+        return f"PlayerRec({self.index}, {self.label!r})"
+
+class GameRec:
+    """One scheduled game; `index` is the game's position in its Lineup"""
+
+    __slots__ = ("index", "game_number", "date", "time", "opponent", "innings")
+
+    def __init__(self, index, game_number, date, time, opponent, innings):
+        self.index = index
+        self.game_number = int(game_number)
+        self.date = date
+        self.time = time
+        self.opponent = opponent
+        self.innings = int(innings) if innings is not None and not pd.isna(innings) else 6
+
+    def __repr__(self):
+        return f"GameRec({self.index}, game {self.game_number} vs {self.opponent!r})"
+
+
+class Lineup:
+    """A team's players and games with O(1) lookups by jersey and game number
+
+    Players and games keep the order they were given in, so their `index` can address
+    rows of per-player or per-game arrays. DataFrames are only built for display.
+    """
+
+    __slots__ = ("players", "games", "jersey_index", "game_index")
+
+    def __init__(self, players=(), games=()):
+        self.players = list(players)
+        self.games = list(games)
+        self.jersey_index = {player.jersey: player.index for player in self.players}
+        self.game_index = {game.game_number: game.index for game in self.games}
+
+    @classmethod
+    def from_rows(cls, player_rows=(), game_rows=()):
+        """Build from (first_name, last_name, jersey) and (game_number, date, time, opponent, innings) rows"""
+        players = [PlayerRec(i, *row) for i, row in enumerate(player_rows)]
+        games = [GameRec(i, *row) for i, row in enumerate(game_rows)]
+        return cls(players, games)
+
+    @classmethod
+    def from_dataframes(cls, roster_df, schedule_df=None):
+        """Build from the roster and schedule DataFrames returned by db_operations"""
+        player_rows = []
+        if roster_df is not None and not roster_df.empty:
+            player_rows = zip(roster_df["First Name"], roster_df["Last Name"], roster_df["Jersey Number"])
+        game_rows = []
+        if schedule_df is not None and not schedule_df.empty:
+            times = schedule_df["Time"] if "Time" in schedule_df else [None] * len(schedule_df)
+            game_rows = zip(schedule_df["Game #"], schedule_df["Date"], times,
+                            schedule_df["Opponent"], schedule_df["Innings"])
+        return cls.from_rows(player_rows, game_rows)
+
+    def __len__(self):
+        return len(self.players)
+
+    def __iter__(self):
+        return iter(self.players)
+
+    def index_of(self, jersey):
+        """Player index for a jersey, or None"""
+        return self.jersey_index.get(str(jersey))
+
+    def player(self, jersey):
+        """PlayerRec for a jersey, or None"""
+        index = self.jersey_index.get(str(jersey))
+        return None if index is None else self.players[index]
+
+    def label(self, jersey, default=None):
+        """Display label for a jersey, or `default` (by default "Jersey #N") when it isn't on the roster"""
+        player = self.player(jersey)
+        if player is not None:
+            return player.label
+        return default if default is not None else f"Jersey #{jersey}"
+
+    def game(self, game_number):
+        """GameRec for a game number, or None"""
+        index = self.game_index.get(int(game_number))
+        return None if index is None else self.games[index]
+
+    def labels(self):
+        return [player.label for player in self.players]
+
+    def roster_df(self):
+        """Roster in the DataFrame shape of db_operations.get_roster"""
+        return pd.DataFrame({
+            "First Name": [player.first_name for player in self.players],
+            "Last Name": [player.last_name for player in self.players],
+            "Jersey Number": [player.jersey for player in self.players]
+        })
+
+    def schedule_df(self):
+        """Schedule in the DataFrame shape of db_operations.get_schedule"""
+        df = pd.DataFrame({
+            "Game #": [game.game_number for game in self.games],
+            "Date": [game.date for game in self.games],
+            "Time": [game.time for game in self.games],
+            "Opponent": [game.opponent for game in self.games],
+            "Innings": [game.innings for game in self.games]
+        })
+        df["Date"] = pd.to_datetime(df["Date"])
+        return df
+
+
+def _format_date(date):
+    """Date as shown in summaries and game plans, e.g. "2025-05-14" """
+    return date.strftime("%Y-%m-%d") if isinstance(date, pd.Timestamp) else str(date)
+
+def _format_time(game_time):
+    """Start time as shown in summaries and game plans, or None when the game has none"""
+    if game_time is None or pd.isna(game_time):
+        return None
+    return game_time.strftime("%I:%M %p") if isinstance(game_time, pd.Timestamp) else str(game_time)
+
+def _grid_label(game):
+    """Batting grid column label, e.g. "Game 3 vs Tigers (05/14 06:30PM)" """
+    label = f"Game {game.game_number} vs {game.opponent}"
+    if pd.notna(game.date):
+        try:
+            label += f" ({game.date.strftime('%m/%d')}"
+            if game.time is not None and pd.notna(game.time):
+                try:
+                    label += f" {game.time.strftime('%I:%M%p')}"
+                except AttributeError:
+                    pass
+            label += ")"
+        except AttributeError:
+            pass
+    return label
+
+
+class ScheduleIndex:
+    """A team's games by game number with their display strings formatted once
+
+    Built from the schedule DataFrame and meant to be reused for as long as the schedule
+    doesn't change (see db_operations.get_schedule_index).
+    """
+
+    __slots__ = ("games", "game_index", "labels", "dates", "times", "date_times")
+
+    def __init__(self, games=()):
+        self.games = list(games)
+        self.game_index = {game.game_number: game for game in self.games}
+        self.labels = {game.game_number: _grid_label(game) for game in self.games}
+        self.dates = {game.game_number: _format_date(game.date) for game in self.games}
+        self.times = {game.game_number: _format_time(game.time) for game in self.games}
+        self.date_times = {
+            number: date if self.times[number] is None else f"{date} at {self.times[number]}"
+            for number, date in self.dates.items()
+        }
+
+    @classmethod
+    def from_dataframe(cls, schedule_df):
+        return cls(Lineup.from_dataframes(None, schedule_df).games)
+
+    def __len__(self):
+        return len(self.games)
+
+    def __contains__(self, game_number):
+        return int(game_number) in self.game_index
+
+    def numbers(self):
+        return [game.game_number for game in self.games]
+
+    def game(self, game_number):
+        """GameRec for a game number, or None"""
+        return self.game_index.get(int(game_number))
+
+    def innings(self, game_number, default=6):
+        game = self.game(game_number)
+        return default if game is None else game.innings
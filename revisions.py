@@ -0,0 +1,40 @@
+import os
+import threading
+import time
+
+# In-process revision counters per team and data scope, bumped by every write.
+# Caches key on these so they invalidate as soon as this process changes a team.
+# Writes made by another server process can't bump them, so revisions also roll
+# over every CACHE_TTL_SECONDS: no cached value outlives that (0 turns it off).
+CACHE_TTL_SECONDS = float(os.getenv("LINEUP_CACHE_TTL_SECONDS", "60"))
+
+SCOPES = ("team", "team_info", "roster", "schedule", "batting_orders", "fielding_rotations", "availability")
+
+_revisions = {}
+_last_write = {}
+_lock = threading.Lock()
+
+
+def bump(team_id, *scopes):
+    """Record a write to a team; the overall "team" revision always advances"""
+    with _lock:
+        for scope in set(scopes) | {"team"}:
+            key = (team_id, scope)
+            _revisions[key] = _revisions.get(key, 0) + 1
+        _last_write[team_id] = time.monotonic()
+
+def get(team_id, scope="team"):
+    """Get the current revision of a team (or one of its data scopes)
+
+    Returns:
+        tuple: (write count, TTL period); compare for equality or use as a cache key
+    """
+    period = int(time.monotonic() // CACHE_TTL_SECONDS) if CACHE_TTL_SECONDS > 0 else 0
+    return _revisions.get((team_id, scope), 0), period
+
+def seconds_since_write(team_id):
+    """Seconds since this process last wrote to a team, or None if it never has"""
+    last = _last_write.get(team_id)
+    if last is None:
+        return None
+    return time.monotonic() - last
@@ -0,0 +1,295 @@
+import numpy as np
+import pandas as pd
+
+# Same positions as lineup.POSITIONS, plus OUT for unavailable players. A position's
+# code is its index here; cells without an assignment hold EMPTY.
+POSITIONS = ["Pitcher", "Catcher", "1B", "2B", "3B", "SS", "LF", "RF", "LC", "RC", "Bench"]
+CODES = POSITIONS + ["OUT"]
+CODE = {name: code for code, name in enumerate(CODES)}
+EMPTY = -1
+BENCH = CODE["Bench"]
+OUT = CODE["OUT"]
+CATCHER = CODE["Catcher"]
+
+INFIELD = ["Pitcher", "1B", "2B", "3B", "SS"]
+OUTFIELD = ["Catcher", "LF", "RF", "LC", "RC"]
+# Codes every inning must fill exactly once
+FIELD_CODES = np.array([CODE[position] for position in POSITIONS if position != "Bench"], dtype=np.int8)
+
+# Position categories; CATEGORY_NAMES matches the column names used by the fairness tables
+INFIELD_CAT, OUTFIELD_CAT, BENCH_CAT, OUT_CAT, NONE_CAT = range(5)
+CATEGORY_NAMES = ["Infield", "Outfield", "Bench", "OUT"]
+
+# Category of each code, shifted by one so EMPTY (-1) maps to NONE_CAT
+_CATEGORY = np.array(
+    [NONE_CAT]
+    + [INFIELD_CAT if name in INFIELD else OUTFIELD_CAT if name in OUTFIELD else BENCH_CAT for name in POSITIONS]
+    + [OUT_CAT],
+    dtype=np.int8
+)
+
+
+def inning_number(key):
+    """Inning number of an "Inning N" key, or None"""
+    if isinstance(key, str) and key.startswith("Inning "):
+        try:
+            return int(key[7:])
+        except ValueError:
+            return None
+    return None
+
+def encode_position(position, strict=True):
+    """Code of a position name; None/blank is EMPTY, unknown names raise unless strict=False"""
+    if position is None or position == "" or (isinstance(position, float) and np.isnan(position)):
+        return EMPTY
+    code = CODE.get(position)
+    if code is None:
+        if strict:
+            raise ValueError(f"Unknown position: {position!r}")
+        return EMPTY
+    return code
+
+def encode(rotation, jerseys=(), innings=None, strict=True):
+    """Encode a stored {"Inning N": {jersey: position}} rotation as an int8 players x innings matrix
+
+    Args:
+        rotation (dict): One game's rotation as stored in FieldingRotation.positions per inning
+        jerseys (list): Row order; jerseys in the rotation but not listed are appended
+        innings (int): Number of columns; defaults to the highest inning in the rotation
+        strict (bool): Raise on unknown position names instead of leaving the cell EMPTY
+
+    Returns:
+        tuple: (matrix, jerseys) where matrix[row, inning - 1] is a position code
+    """
+    jerseys = [str(jersey) for jersey in jerseys]
+    rows = {jersey: row for row, jersey in enumerate(jerseys)}
+    columns = {}
+    for key, positions in (rotation or {}).items():
+        number = inning_number(key)
+        if number is None or number < 1 or not isinstance(positions, dict):
+            continue
+        columns[number] = positions
+        for jersey in positions:
+            jersey = str(jersey)
+            if jersey not in rows:
+                rows[jersey] = len(jerseys)
+                jerseys.append(jersey)
+
+    if innings is None:
+        innings = max(columns, default=0)
+    matrix = np.full((len(jerseys), innings), EMPTY, dtype=np.int8)
+    for number, positions in columns.items():
+        if number > innings:
+            continue
+        for jersey, position in positions.items():
+            matrix[rows[str(jersey)], number - 1] = encode_position(position, strict)
+    return matrix, jerseys
+
+def encode_grid(values, strict=False):
+    """Encode a 2-D sequence of position names, e.g. a players x innings editor grid"""
+    rows = [[encode_position(value, strict) for value in row] for row in values]
+    return np.array(rows, dtype=np.int8).reshape(len(rows), len(rows[0]) if rows else 0)
+
+def encode_season(rotations, jerseys, innings):
+    """Encode {game_number: rotation} as a games x players x innings tensor
+
+    Jerseys outside `jerseys` and innings past `innings` are left out, unknown
+    positions are left EMPTY, and games shorter than `innings` are padded with EMPTY.
+
+    Returns:
+        tuple: (tensor, game_numbers) with tensor[g] holding game game_numbers[g]
+    """
+    rows = {str(jersey): row for row, jersey in enumerate(jerseys)}
+    game_numbers = list(rotations)
+    tensor = np.full((len(game_numbers), len(rows), innings), EMPTY, dtype=np.int8)
+    for g, game_number in enumerate(game_numbers):
+        for key, positions in rotations[game_number].items():
+            number = inning_number(key)
+            if number is None or not 1 <= number <= innings or not isinstance(positions, dict):
+                continue
+            for jersey, position in positions.items():
+                row = rows.get(str(jersey))
+                if row is not None:
+                    tensor[g, row, number - 1] = encode_position(position, strict=False)
+    return tensor, game_numbers
+
+def decode(matrix, jerseys):
+    """Turn a matrix back into the stored {"Inning N": {jersey: position}} form
+
+    EMPTY cells are left out, as are innings without any assignment.
+    """
+    rotation = {}
+    for column in range(matrix.shape[1]):
+        positions = {jerseys[row]: CODES[code] for row, code in enumerate(matrix[:, column]) if code != EMPTY}
+        if positions:
+            rotation[f"Inning {column + 1}"] = positions
+    return rotation
+
+def categories(matrix):
+    """Category (INFIELD_CAT, OUTFIELD_CAT, ...) of every cell"""
+    return _CATEGORY[matrix.astype(np.int16) + 1]
+
+def category_counts(matrix):
+    """Innings per category along the last axis
+
+    Returns:
+        ndarray: Shape matrix.shape[:-1] + (4,) with Infield, Outfield, Bench and OUT counts
+    """
+    cats = categories(matrix)
+    return np.stack([(cats == category).sum(axis=-1) for category in range(len(CATEGORY_NAMES))], axis=-1)
+
+def position_counts(matrix, axis):
+    """Occurrences of every code along an axis (0: per inning, 1: per player)
+
+    Returns:
+        ndarray: Counts with a trailing axis of len(CODES)
+    """
+    return (matrix[..., None] == np.arange(len(CODES), dtype=np.int8)).sum(axis=axis)
+
+
+def fairness_table(matrix, index, categories=CATEGORY_NAMES):
+    """Innings per category, total innings and percentages for each player
+
+    Args:
+        matrix (ndarray): players x innings for one game, or games x players x innings for a season
+        index: Row labels, one per player
+        categories (list): Category columns to include, from CATEGORY_NAMES
+
+    Returns:
+        DataFrame: The category counts, "Total Innings", then a "<category> %" column for each
+    """
+    counts = category_counts(matrix)
+    assigned = matrix != EMPTY
+    if matrix.ndim == 3:
+        counts = counts.sum(axis=0)
+        assigned = assigned.sum(axis=(0, 2))
+    else:
+        assigned = assigned.sum(axis=-1)
+    return _table(counts, assigned, index, categories)
+
+def _table(counts, assigned, index, categories):
+    counts = counts[:, [CATEGORY_NAMES.index(name) for name in categories]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentages = np.round(counts / assigned[:, None] * 100, 1)
+
+    columns = {name: counts[:, i] for i, name in enumerate(categories)}
+    columns["Total Innings"] = assigned
+    columns.update({f"{name} %": percentages[:, i] for i, name in enumerate(categories)})
+    return pd.DataFrame(columns, index=index)
+
+def game_stats(rotation, jerseys, index, innings=None):
+    """fairness_table of one game's stored rotation, with a row per jersey in `jerseys`"""
+    matrix, _ = encode(rotation, jerseys, innings, strict=False)
+    return fairness_table(matrix[:len(jerseys)], index)
+
+
+def check(matrix, required=FIELD_CODES):
+    """Find rule violations in one game's matrix
+
+    Returns:
+        dict:
+            missing: [(inning, [codes])] required positions nobody plays
+            duplicates: [(inning, [codes])] non-bench positions played by several players
+            repeated: [(row, {code: count})] non-bench positions a player plays more than once
+                (players with any bench inning are skipped, as the validators always have)
+            consecutive: [(row, prev_inning, inning, "infield" | "outfield")] same category in back-to-back innings
+    """
+    per_inning = position_counts(matrix, axis=0)   # innings x codes
+    per_player = position_counts(matrix, axis=1)   # players x codes
+    field = np.ones(len(CODES), dtype=bool)
+    field[[BENCH, OUT]] = False
+
+    missing = []
+    duplicates = []
+    for column in range(matrix.shape[1]):
+        counts = per_inning[column]
+        missing_codes = [int(code) for code in required if counts[code] == 0]
+        duplicate_codes = [code for code in np.flatnonzero((counts > 1) & field)]
+        if missing_codes:
+            missing.append((column + 1, missing_codes))
+        if duplicate_codes:
+            duplicates.append((column + 1, [int(code) for code in duplicate_codes]))
+
+    # Report players in the order they first take the field, and each player's repeated
+    # positions in the order they are first played
+    playing = (matrix != OUT) & (matrix != EMPTY)
+    first_inning = np.where(playing.any(axis=1), playing.argmax(axis=1), matrix.shape[1])
+    order = {int(row): rank for rank, row in enumerate(np.lexsort((np.arange(len(matrix)), first_inning)))}
+
+    repeated = []
+    for row in np.flatnonzero(((per_player > 1) & field).any(axis=1) & (per_player[:, BENCH] == 0)):
+        codes = np.flatnonzero((per_player[row] > 1) & field)
+        codes = sorted(codes, key=lambda code: (matrix[row] == code).argmax())
+        repeated.append((int(row), {int(code): int(per_player[row, code]) for code in codes}))
+    repeated.sort(key=lambda issue: order[issue[0]])
+
+    cats = categories(matrix)
+    same = (cats[:, 1:] == cats[:, :-1]) & ((cats[:, 1:] == INFIELD_CAT) | (cats[:, 1:] == OUTFIELD_CAT))
+    consecutive = [
+        (int(row), int(column) + 1, int(column) + 2, "infield" if cats[row, column + 1] == INFIELD_CAT else "outfield")
+        for row, column in np.argwhere(same)
+    ]
+    consecutive.sort(key=lambda issue: order[issue[0]])
+    return {"missing": missing, "duplicates": duplicates, "repeated": repeated, "consecutive": consecutive}
+
+
+class FairnessLedger:
+    """Season innings per category and per position for each player, kept in memory and updated cell by cell
+
+    Built once from the stored season; previews of unsaved edits only touch the cells that
+    changed instead of recounting the season.
+    """
+
+    __slots__ = ("rows", "counts", "positions")
+
+    def __init__(self, jerseys, counts, positions=None):
+        self.rows = {str(jersey): row for row, jersey in enumerate(jerseys)}
+        # players x (categories + NONE_CAT); the last column absorbs EMPTY cells
+        self.counts = counts
+        # players x (EMPTY + codes), shifted by one like _CATEGORY
+        self.positions = np.zeros((len(self.rows), len(CODES) + 1), dtype=np.int32) if positions is None else positions
+
+    @classmethod
+    def from_season(cls, season, jerseys):
+        """Build from a games x players x innings tensor (see encode_season)"""
+        counts = np.zeros((len(jerseys), NONE_CAT + 1), dtype=np.int32)
+        counts[:, :NONE_CAT] = category_counts(season).sum(axis=0)
+        positions = np.zeros((len(jerseys), len(CODES) + 1), dtype=np.int32)
+        positions[:, 1:] = position_counts(season, axis=2).sum(axis=0)
+        return cls(jerseys, counts, positions)
+
+    def apply(self, jerseys, stored, edited):
+        """Ledger with one game's edits applied: every changed cell moves an inning between categories
+
+        Args:
+            jerseys (list): Jersey of each matrix row
+            stored (ndarray): players x innings the season was counted with
+            edited (ndarray): The same game after the edits
+
+        Returns:
+            FairnessLedger: A new ledger; this one is left unchanged
+        """
+        counts = self.counts.copy()
+        positions = self.positions.copy()
+        changed_rows, changed_columns = np.nonzero(stored != edited)
+        rows = np.array([self.rows.get(str(jerseys[row]), -1) for row in changed_rows], dtype=np.intp)
+        known = rows >= 0
+        rows = rows[known]
+        before = stored[changed_rows[known], changed_columns[known]]
+        after = edited[changed_rows[known], changed_columns[known]]
+        np.add.at(counts, (rows, categories(before)), -1)
+        np.add.at(counts, (rows, categories(after)), 1)
+        np.add.at(positions, (rows, before.astype(np.intp) + 1), -1)
+        np.add.at(positions, (rows, after.astype(np.intp) + 1), 1)
+        ledger = FairnessLedger.__new__(FairnessLedger)
+        ledger.rows = self.rows
+        ledger.counts = counts
+        ledger.positions = positions
+        return ledger
+
+    def table(self, jerseys, index, categories=CATEGORY_NAMES[:3]):
+        """fairness_table-style season totals for the given jerseys (missing jerseys count zero)"""
+        rows = [self.rows.get(str(jersey)) for jersey in jerseys]
+        counts = np.array([self.counts[row] if row is not None else np.zeros(NONE_CAT + 1, dtype=np.int32)
+                           for row in rows]).reshape(len(rows), NONE_CAT + 1)
+        return _table(counts[:, :NONE_CAT], counts[:, :NONE_CAT].sum(axis=1), index, categories)
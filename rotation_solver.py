@@ -0,0 +1,314 @@
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+
+import rotation_matrix as rm
+
+# Objective weights: any rule violation outweighs every fairness difference
+VIOLATION_WEIGHT = 100.0
+COVERAGE_WEIGHT = 0.5
+# Per inning of difference between the most and least benched players in the game
+GAME_BENCH_WEIGHT = 1.0
+
+# Local search swaps tried per restart without improvement before giving up
+PATIENCE = 150
+
+_PITCHER = rm.CODE["Pitcher"]
+# Pitcher's column in per-player FIELD_CODES counts
+PITCHER_COLUMN = int(np.flatnonzero(rm.FIELD_CODES == _PITCHER)[0])
+
+
+class Problem:
+    """One game's rotation search: who can play, and the season the candidates are scored against
+
+    Rows follow `jerseys`. The season counts leave out the game being planned, so a candidate's
+    own innings are added on top of them when it is scored. `pitch_limit` holds the innings each
+    player may pitch in this game (see pitching.PitchingLedger.limits); None means no limit.
+    """
+
+    __slots__ = ("jerseys", "available", "can_catch", "innings", "season_categories", "season_positions",
+                 "pitch_limit")
+
+    def __init__(self, jerseys, available, can_catch, innings, season_categories, season_positions,
+                 pitch_limit=None):
+        self.jerseys = [str(jersey) for jersey in jerseys]
+        self.available = np.asarray(available, dtype=bool)
+        self.can_catch = np.asarray(can_catch, dtype=bool)
+        self.innings = int(innings)
+        # players x categories (Infield, Outfield, Bench, OUT) and players x codes
+        self.season_categories = season_categories
+        self.season_positions = season_positions
+        self.pitch_limit = None if pitch_limit is None else np.asarray(pitch_limit, dtype=np.int32)
+
+    @classmethod
+    def from_ledger(cls, ledger, jerseys, stored, available, can_catch, innings, pitch_limit=None):
+        """Build from the season ledger, taking the game's stored matrix back out of it
+
+        Args:
+            ledger (FairnessLedger): Season counts, including the stored game
+            jerseys (list): Row order
+            stored (ndarray): players x innings matrix of the game as saved (EMPTY where unsaved)
+            available, can_catch (sequence): Per-player flags for this game
+            innings (int): Game length
+            pitch_limit (sequence): Optional innings each player may pitch in this game
+        """
+        without = ledger.apply(jerseys, stored, np.full(stored.shape, rm.EMPTY, dtype=np.int8))
+        rows = [without.rows.get(str(jersey)) for jersey in jerseys]
+        categories = np.zeros((len(jerseys), len(rm.CATEGORY_NAMES)), dtype=np.int32)
+        positions = np.zeros((len(jerseys), len(rm.CODES)), dtype=np.int32)
+        for i, row in enumerate(rows):
+            if row is not None:
+                categories[i] = without.counts[row, :len(rm.CATEGORY_NAMES)]
+                positions[i] = without.positions[row, 1:]
+        return cls(jerseys, available, can_catch, innings, categories, positions, pitch_limit)
+
+
+def construct(problem, rng):
+    """Build one rotation inning by inning, giving each field position to the best-suited free player
+
+    Catcher goes first and only to capable players, and Pitcher only to players with innings left
+    under their pitch limit; otherwise players who've sat more (this game, then this season) go in
+    first, avoiding repeated positions and back-to-back infield or outfield.
+    Random noise makes every call a different restart.
+
+    Returns:
+        ndarray: players x innings matrix
+    """
+    size = len(problem.jerseys)
+    matrix = np.full((size, problem.innings), rm.BENCH, dtype=np.int8)
+    matrix[~problem.available] = rm.OUT
+    rows = np.flatnonzero(problem.available)
+    if len(rows) == 0:
+        return matrix
+
+    season = problem.season_categories[rows]
+    played = season[:, :rm.OUT_CAT].sum(axis=1)
+    season_bench = np.divide(season[:, rm.BENCH_CAT], played, out=np.zeros(len(rows)), where=played > 0)
+    played_here = np.zeros((len(rows), len(rm.CODES)), dtype=bool)
+    game_bench = np.zeros(len(rows))
+    previous = np.full(len(rows), rm.NONE_CAT)
+    pitch_left = None if problem.pitch_limit is None else problem.pitch_limit[rows].copy()
+
+    others = [code for code in rm.FIELD_CODES if code != rm.CATCHER]
+    for column in range(problem.innings):
+        free = np.ones(len(rows), dtype=bool)
+        current = np.full(len(rows), rm.BENCH_CAT)
+        for code in [rm.CATCHER] + list(rng.permutation(others)):
+            if not free.any():
+                break
+            category = rm.categories(np.int8(code))
+            cost = (
+                VIOLATION_WEIGHT * played_here[:, code]
+                + VIOLATION_WEIGHT * (previous == category)
+                - 3.0 * game_bench
+                - 2.0 * season_bench
+                + rng.random(len(rows)) * 1.5
+            )
+            if code == rm.CATCHER:
+                cost = cost + 10 * VIOLATION_WEIGHT * ~problem.can_catch[rows]
+            elif code == _PITCHER and pitch_left is not None:
+                cost = cost + 10 * VIOLATION_WEIGHT * (pitch_left <= 0)
+            cost[~free] = np.inf
+            pick = int(np.argmin(cost))
+            matrix[rows[pick], column] = code
+            free[pick] = False
+            played_here[pick, code] = True
+            current[pick] = category
+            if code == _PITCHER and pitch_left is not None:
+                pitch_left[pick] -= 1
+        game_bench += free
+        previous = current
+    return matrix
+
+
+def objective(matrix, problem):
+    """Lower is better: weighted violations, spread of season bench %, uncovered positions and uneven bench innings"""
+    return _total(*_parts(matrix, problem))
+
+def _total(violations, bench_spread, coverage, game_bench):
+    return (VIOLATION_WEIGHT * violations + bench_spread + COVERAGE_WEIGHT * (100.0 - coverage)
+            + GAME_BENCH_WEIGHT * (game_bench[1] - game_bench[0]))
+
+def count_violations(game, cats, per_player, can_catch, pitch_limit=None):
+    """Rule violations the validator reports, counted the way rotation_matrix.check counts them
+
+    A player with any bench inning is exempt from the repeated-position rule, as in check().
+
+    Args:
+        game (ndarray): Available players x innings
+        cats (ndarray): rotation_matrix.categories(game)
+        per_player (ndarray): Field position counts per player, players x FIELD_CODES
+        can_catch (ndarray): Per-player catcher flags
+        pitch_limit (ndarray): Optional per-player pitch limits; each inning over one counts
+    """
+    benched = (game == rm.BENCH).any(axis=1)
+    repeated = int(np.maximum(per_player[~benched] - 1, 0).sum())
+    consecutive = int(((cats[:, 1:] == cats[:, :-1]) & (cats[:, 1:] <= rm.OUTFIELD_CAT)).sum())
+    bad_catcher = int(((game == rm.CATCHER) & ~can_catch[:, None]).sum())
+    over_limit = 0
+    if pitch_limit is not None:
+        over_limit = int(np.maximum(per_player[:, PITCHER_COLUMN] - pitch_limit, 0).sum())
+    return repeated + consecutive + bad_catcher + over_limit
+
+def _parts(matrix, problem):
+    rows = np.flatnonzero(problem.available)
+    if len(rows) == 0:
+        return 0, 0.0, 100.0, (0, 0)
+    game = matrix[rows]
+
+    per_player = rm.position_counts(game, axis=1)[:, rm.FIELD_CODES]
+    cats = rm.categories(game)
+    pitch_limit = None if problem.pitch_limit is None else problem.pitch_limit[rows]
+    violations = count_violations(game, cats, per_player, problem.can_catch[rows], pitch_limit)
+
+    # Season bench % of each available player with this game added
+    counts = problem.season_categories[rows].copy()
+    for category in (rm.INFIELD_CAT, rm.OUTFIELD_CAT, rm.BENCH_CAT):
+        counts[:, category] += (cats == category).sum(axis=1)
+    benched = (cats == rm.BENCH_CAT).sum(axis=1)
+    played = counts[:, :rm.OUT_CAT].sum(axis=1)
+    bench = np.divide(counts[:, rm.BENCH_CAT], played, out=np.zeros(len(rows)), where=played > 0) * 100
+    bench_spread = float(bench.std())
+
+    # Share of the field positions each player has played at least once this season
+    positions = problem.season_positions[rows][:, rm.FIELD_CODES] + per_player
+    coverage = float((positions > 0).mean() * 100)
+    return violations, bench_spread, coverage, (int(benched.min()), int(benched.max()))
+
+def score(matrix, problem):
+    """Score a candidate rotation
+
+    Returns:
+        dict: violations (count, including innings over a pitch limit), bench_spread (std dev of season bench %, points),
+            coverage (% of field positions each player has played this season),
+            game_bench ((fewest, most) bench innings of an available player this game), total (objective)
+    """
+    parts = _parts(matrix, problem)
+    violations, bench_spread, coverage, game_bench = parts
+    return {
+        "violations": violations,
+        "bench_spread": round(bench_spread, 2),
+        "coverage": round(coverage, 1),
+        "game_bench": game_bench,
+        "total": round(_total(*parts), 3),
+    }
+
+
+def improve(matrix, problem, rng, patience=PATIENCE):
+    """Local search: swap two available players within an inning while it doesn't make things worse"""
+    rows = np.flatnonzero(problem.available)
+    if len(rows) < 2:
+        return matrix, objective(matrix, problem)
+    best = objective(matrix, problem)
+    misses = 0
+    while misses < patience:
+        column = int(rng.integers(problem.innings))
+        first, second = rng.choice(rows, size=2, replace=False)
+        if matrix[first, column] == matrix[second, column]:
+            misses += 1
+            continue
+        matrix[[first, second], column] = matrix[[second, first], column]
+        value = objective(matrix, problem)
+        if value < best:
+            best = value
+            misses = 0
+        elif value == best:
+            misses += 1
+        else:
+            matrix[[first, second], column] = matrix[[second, first], column]
+            misses += 1
+    return matrix, best
+
+def _restarts(problem, seed, deadline, keep):
+    """Randomized restarts until the wall-clock deadline (at least one); returns the best `keep` distinct"""
+    rng = np.random.default_rng(seed)
+    found = {}
+    runs = 0
+    while True:
+        matrix, value = improve(construct(problem, rng), problem, rng)
+        found.setdefault(matrix.tobytes(), (value, matrix))
+        runs += 1
+        if time.time() >= deadline:
+            break
+    best = sorted(found.values(), key=lambda item: item[0])[:keep]
+    return best, runs
+
+
+# Worker processes are started once and reused by later searches
+_pool = None
+_pool_workers = 0
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        # spawn: forking a process that runs Streamlit's threads isn't safe
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _pool_workers = workers
+    return _pool
+
+def _reset_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+
+def search(problem, k=3, time_budget=2.0, workers=None, seed=None, min_distance=None):
+    """Find up to `k` good, mutually different rotations for a game
+
+    Each worker runs randomized restarts of construct + improve until the time budget runs out.
+    With one core (or if worker processes can't be used) the restarts run in this process.
+
+    Args:
+        problem (Problem): The game to plan
+        k (int): Number of candidates to return
+        time_budget (float): Seconds to search for
+        workers (int): Worker processes; defaults to the number of cores
+        seed (int): Seed for repeatable searches
+        min_distance (int): Cells in which every returned pair must differ; defaults to a fifth
+            of the available players' cells
+
+    Returns:
+        tuple: (candidates, rotations_tried) with candidates a best-first list of
+            {"matrix": ndarray, "score": dict}
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, os.cpu_count() or 1))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    deadline = time.time() + max(float(time_budget), 0.0)
+    keep = 4 * k
+
+    results = []
+    if workers > 1:
+        try:
+            pool = _get_pool(workers)
+            futures = [pool.submit(_restarts, problem, child, deadline, keep) for child in seeds]
+            done, _ = wait(futures, timeout=max(deadline - time.time(), 0.0) + 2.0)
+            results = [future.result() for future in done]
+        except Exception as e:
+            # Any worker failure (broken pool, pickling, an error raised inside _restarts) falls back
+            print(f"Parallel rotation search failed, searching in-process: {type(e).__name__}: {str(e)}")
+            _reset_pool()
+            results = []
+    if not results:
+        results = [_restarts(problem, seeds[0], deadline, keep)]
+
+    found = {}
+    for best, _ in results:
+        for value, matrix in best:
+            found.setdefault(matrix.tobytes(), (value, matrix))
+    ranked = sorted(found.values(), key=lambda item: item[0])
+
+    if min_distance is None:
+        min_distance = max(1, int(problem.available.sum()) * problem.innings // 5)
+    chosen = []
+    for value, matrix in ranked:
+        if all((matrix != other).sum() >= min_distance for other in chosen):
+            chosen.append(matrix)
+            if len(chosen) == k:
+                break
+    candidates = [{"matrix": matrix, "score": score(matrix, problem)} for matrix in chosen]
+    return candidates, sum(runs for _, runs in results)
@@ -0,0 +1,241 @@
+import csv
+import glob
+import io
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from database import get_db_session, Team, Player, Game, BattingOrder, FieldingRotation, PlayerAvailability
+
+# Rows fetched per round trip; on PostgreSQL this also enables a server-side cursor
+DEFAULT_BATCH_SIZE = 1000
+# Prepared exports nobody downloaded are removed after this long
+STALE_EXPORT_SECONDS = 3600
+_EXPORT_PREFIX = "lineup_season_"
+
+EXPORT_TABLES = {
+    "players": ["team_id", "team_name", "player_id", "first_name", "last_name", "jersey_number"],
+    "games": ["team_id", "team_name", "game_id", "game_number", "date", "time", "opponent", "innings"],
+    "batting_orders": ["team_id", "game_number", "slot", "jersey_number"],
+    "fielding_rotations": ["team_id", "game_number", "inning", "jersey_number", "position"],
+    "availability": ["team_id", "game_number", "jersey_number", "available", "can_play_catcher"],
+}
+
+_INTEGER_COLUMNS = {"team_id", "player_id", "game_id", "game_number", "innings", "slot", "inning"}
+_BOOLEAN_COLUMNS = {"available", "can_play_catcher"}
+
+
+def _user_team_ids(session, user_id):
+    """Subquery of the team IDs visible to a user"""
+    return session.query(Team.id).filter(
+        (Team.user_id == user_id) | (Team.user_id == None)
+    ).scalar_subquery()
+
+def _iter_players(session, team_ids, batch_size):
+    query = session.query(
+        Team.id, Team.name, Player.id, Player.first_name, Player.last_name, Player.jersey_number
+    ).join(Player, Player.team_id == Team.id).filter(Team.id.in_(team_ids)).order_by(Team.id, Player.id)
+    for row in query.yield_per(batch_size):
+        yield tuple(row)
+
+def _iter_games(session, team_ids, batch_size):
+    query = session.query(
+        Team.id, Team.name, Game.id, Game.game_number, Game.date, Game.time, Game.opponent, Game.innings
+    ).join(Game, Game.team_id == Team.id).filter(Team.id.in_(team_ids)).order_by(Team.id, Game.game_number)
+    for row in query.yield_per(batch_size):
+        yield tuple(row)
+
+def _iter_batting_orders(session, team_ids, batch_size):
+    query = session.query(
+        Game.team_id, Game.game_number, BattingOrder.order_data
+    ).join(Game).filter(Game.team_id.in_(team_ids)).order_by(Game.team_id, Game.game_number)
+    for team_id, game_number, order_data in query.yield_per(batch_size):
+        # Flatten the stored list into one row per batting slot
+        for slot, jersey in enumerate(order_data or [], 1):
+            yield (team_id, game_number, slot, jersey)
+
+def _iter_fielding_rotations(session, team_ids, batch_size):
+    query = session.query(
+        Game.team_id, Game.game_number, FieldingRotation.inning, FieldingRotation.positions
+    ).join(Game).filter(Game.team_id.in_(team_ids)).order_by(Game.team_id, Game.game_number, FieldingRotation.inning)
+    for team_id, game_number, inning, positions in query.yield_per(batch_size):
+        # Flatten the stored {jersey: position} dictionary into one row per player
+        for jersey, position in (positions or {}).items():
+            yield (team_id, game_number, inning, jersey, position)
+
+def _iter_availability(session, team_ids, batch_size):
+    query = session.query(
+        Game.team_id, Game.game_number, Player.jersey_number,
+        PlayerAvailability.available, PlayerAvailability.can_play_catcher
+    ).join(Game, PlayerAvailability.game_id == Game.id).join(
+        Player, PlayerAvailability.player_id == Player.id
+    ).filter(Game.team_id.in_(team_ids)).order_by(Game.team_id, Game.game_number)
+    for row in query.yield_per(batch_size):
+        yield tuple(row)
+
+_ROW_SOURCES = {
+    "players": _iter_players,
+    "games": _iter_games,
+    "batting_orders": _iter_batting_orders,
+    "fielding_rotations": _iter_fielding_rotations,
+    "availability": _iter_availability,
+}
+
+
+class _CSVZipSink:
+    """Write each table as a CSV entry of a zip archive, row by row"""
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def write_table(self, name, columns, rows, batch_size):
+        count = 0
+        with self.archive.open(f"{name}.csv", "w") as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            writer = csv.writer(text)
+            writer.writerow(columns)
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    writer.writerows(batch)
+                    count += len(batch)
+                    batch = []
+            writer.writerows(batch)
+            count += len(batch)
+            text.flush()
+            text.detach()
+        return count
+
+    def close(self):
+        self.archive.close()
+
+class _ParquetSink:
+    """Write each table as a Parquet file, one row group per batch, bundled into a zip"""
+
+    def __init__(self, path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow. Run: pip install pyarrow")
+        self.path = path
+        self.workdir = tempfile.mkdtemp(prefix="lineup_export_")
+
+    def write_table(self, name, columns, rows, batch_size):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        count = 0
+        writer = None
+        file_path = os.path.join(self.workdir, f"{name}.parquet")
+        try:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    writer = self._write_batch(pa, pq, writer, file_path, columns, batch)
+                    count += len(batch)
+                    batch = []
+            if batch or writer is None:
+                writer = self._write_batch(pa, pq, writer, file_path, columns, batch)
+                count += len(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+        return count
+
+    @staticmethod
+    def _write_batch(pa, pq, writer, file_path, columns, batch):
+        # Explicit column types keep the schema stable even for all-null batches
+        fields = []
+        arrays = []
+        for i, column in enumerate(columns):
+            if column in _INTEGER_COLUMNS:
+                arrow_type = pa.int64()
+                values = [None if row[i] is None else int(row[i]) for row in batch]
+            elif column in _BOOLEAN_COLUMNS:
+                arrow_type = pa.bool_()
+                values = [None if row[i] is None else bool(row[i]) for row in batch]
+            else:
+                # Dates, times and text are written as strings
+                arrow_type = pa.string()
+                values = [None if row[i] is None else str(row[i]) for row in batch]
+            fields.append(pa.field(column, arrow_type))
+            arrays.append(pa.array(values, type=arrow_type))
+        table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+        if writer is None:
+            writer = pq.ParquetWriter(file_path, table.schema)
+        writer.write_table(table)
+        return writer
+
+    def close(self):
+        try:
+            # Parquet is already compressed, so store the files as-is
+            with zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_STORED) as archive:
+                for name in sorted(os.listdir(self.workdir)):
+                    archive.write(os.path.join(self.workdir, name), arcname=name)
+        finally:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def export_season(user_id, path, fmt="csv", batch_size=DEFAULT_BATCH_SIZE):
+    """Stream every team's season data for a user into a zip file
+
+    Args:
+        user_id (int): Owner of the teams to export
+        path (str): Destination zip file
+        fmt (str): "csv" for one CSV per table or "parquet" for one Parquet file per table
+        batch_size (int): Rows fetched and written per batch
+
+    Returns:
+        dict: Number of rows written per table
+    """
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    sink = _ParquetSink(path) if fmt == "parquet" else _CSVZipSink(path)
+    session = get_db_session()
+    counts = {}
+    try:
+        team_ids = _user_team_ids(session, user_id)
+        for name, columns in EXPORT_TABLES.items():
+            rows = _ROW_SOURCES[name](session, team_ids, batch_size)
+            counts[name] = sink.write_table(name, columns, rows, batch_size)
+    finally:
+        session.close()
+        sink.close()
+    return counts
+
+def export_season_to_tempfile(user_id, fmt="csv", batch_size=DEFAULT_BATCH_SIZE):
+    """Export a season to a new temporary zip file and return (path, counts)
+
+    The caller deletes the file once it has been served; remove_stale_exports cleans up
+    files whose session never downloaded them.
+    """
+    handle, path = tempfile.mkstemp(prefix=_EXPORT_PREFIX, suffix=".zip")
+    os.close(handle)
+    try:
+        counts = export_season(user_id, path, fmt, batch_size)
+    except Exception:
+        os.remove(path)
+        raise
+    return path, counts
+
+def remove_stale_exports(max_age=STALE_EXPORT_SECONDS):
+    """Delete temporary export files older than max_age seconds
+
+    Returns:
+        int: Number of files removed
+    """
+    removed = 0
+    cutoff = time.time() - max_age
+    for path in glob.glob(os.path.join(tempfile.gettempdir(), f"{_EXPORT_PREFIX}*.zip")):
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
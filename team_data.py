@@ -0,0 +1,57 @@
+import db_async
+import db_operations as db
+
+
+class TeamData:
+    """Lazily loaded view of a team's data for one rerun
+
+    Each attribute is fetched from the database the first time a page reads it and
+    reused for the rest of the rerun, so a page only pays for the data it touches.
+
+    Values are shared by everything that reads them during the rerun, so treat them as
+    read-only: copy a DataFrame (or use assign) before adding or changing columns.
+    """
+
+    LOADERS = {
+        "team_info": db.get_team_info,
+        "roster": db.get_roster,
+        "schedule": db.get_schedule,
+        "batting_orders": db.get_batting_orders,
+        "fielding_rotations": db.get_fielding_rotations,
+        "availability": db.get_player_availability,
+        "lineup": db.get_lineup,
+    }
+
+    def __init__(self, team_id, needs=()):
+        self.team_id = team_id
+        # Data the page declared it reads
+        self.needs = list(needs)
+
+    def __getattr__(self, name):
+        # Only called when the attribute hasn't been loaded yet
+        loader = TeamData.LOADERS.get(name)
+        if loader is None:
+            raise AttributeError(name)
+        value = loader(self.team_id)
+        setattr(self, name, value)
+        return value
+
+    def prefetch(self):
+        """Load every declared need up front, concurrently when the async layer is available
+
+        Without it (or if the concurrent load fails) the data keeps loading lazily on first use.
+        """
+        missing = [name for name in self.needs if name in db.READS and not self.is_loaded(name)]
+        if len(missing) < 2 or not db_async.available():
+            return
+        try:
+            values = db_async.load_team_data(self.team_id, missing)
+        except Exception as e:
+            print(f"Concurrent load failed, loading on demand: {str(e)}")
+            return
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def is_loaded(self, name):
+        """Check whether a piece of data has already been fetched"""
+        return name in self.__dict__
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+# The app modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """Point database at a fresh SQLite file with every table created"""
+    import database
+
+    previous = (database.DATABASE_URL, database.DATABASE_READ_URL)
+    database.configure(f"sqlite:///{tmp_path / 'lineup.db'}")
+    database.create_tables()
+    yield database
+    database.configure(*previous)
@@ -0,0 +1,32 @@
+import numpy as np
+
+import availability_matrix
+from records import Lineup
+
+
+def _lineup():
+    return Lineup.from_rows([("Ann", "Lee", "7"), ("Bo", "Kim", "9")],
+                            [(1, "2026-05-04", None, "Tigers", 6), (2, "2026-05-05", None, "Bears", 6)])
+
+
+def test_from_availability_fills_defaults_and_skips_unknown_cells():
+    available, can_catch = availability_matrix.from_availability(_lineup(), {
+        2: {"Available": {"9": False, "99": False}, "Can Play Catcher": {"7": True}},
+        5: {"Available": {"7": False}},
+    })
+    assert available.tolist() == [[True, True], [True, False]]
+    assert can_catch.tolist() == [[False, True], [False, False]]
+
+def test_frame_round_trip_and_changed_cells():
+    lineup = _lineup()
+    available = np.ones((2, 2), dtype=bool)
+    can_catch = np.zeros((2, 2), dtype=bool)
+    frame = availability_matrix.to_frame(lineup, available)
+    assert list(frame.columns) == ["G1 vs Tigers", "G2 vs Bears"]
+    frame.iloc[1, 0] = False
+    new_available = availability_matrix.from_frame(frame)
+    new_can_catch = can_catch.copy()
+    new_can_catch[0, 1] = True
+    assert availability_matrix.changed_cells(lineup, available, can_catch, new_available, new_can_catch) == [
+        ("7", 2, True, True), ("9", 1, False, False)
+    ]
@@ -0,0 +1,38 @@
+import numpy as np
+
+import batting_engine
+from records import Lineup
+
+
+def _lineup(players=4, games=4):
+    return Lineup.from_rows([("Player", str(n), str(n)) for n in range(players)],
+                            [(g + 1, "2026-05-04", None, "Tigers", 6) for g in range(games)])
+
+
+def test_slot_counts_skips_unavailable_players_and_skipped_games():
+    lineup = _lineup(3, 2)
+    available = np.ones((3, 2), dtype=bool)
+    available[0, 0] = False
+    counts = batting_engine.slot_counts(lineup, {1: ["0", "1", "2"], 2: ["2", "1", "0"]}, available, skip=[2])
+    assert counts.tolist() == [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+
+def test_plan_season_gives_every_player_every_slot_once():
+    lineup = _lineup()
+    orders = batting_engine.plan_season(lineup, np.ones((4, 4), dtype=bool))
+    counts = batting_engine.slot_counts(lineup, orders)
+    assert (counts == 1).all()
+
+def test_plan_season_puts_unavailable_players_last():
+    lineup = _lineup(3, 1)
+    available = np.array([[False], [True], [True]])
+    orders = batting_engine.plan_season(lineup, available)
+    assert orders[1][-1] == "0" and sorted(orders[1][:2]) == ["1", "2"]
+
+def test_plan_day_moves_players_between_bands():
+    lineup = _lineup(6, 3)
+    orders = batting_engine.plan_day(lineup, np.ones((6, 3), dtype=bool), [1, 2, 3])
+    bands = {jersey: set() for jersey in orders[1]}
+    for order in orders.values():
+        for slot, jersey in enumerate(order):
+            bands[jersey].add(slot * batting_engine.DAY_BANDS // len(order))
+    assert all(len(seen) == 3 for seen in bands.values())
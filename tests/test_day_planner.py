@@ -0,0 +1,34 @@
+import numpy as np
+
+import day_planner
+import rotation_matrix as rm
+import rotation_solver
+
+PLAYERS = 12
+
+
+def _problem(pitch_limit=None):
+    return rotation_solver.Problem(
+        [str(jersey) for jersey in range(PLAYERS)], [True] * PLAYERS, [True] * PLAYERS, 6,
+        np.zeros((PLAYERS, len(rm.CATEGORY_NAMES)), dtype=np.int32),
+        np.zeros((PLAYERS, len(rm.CODES)), dtype=np.int32), pitch_limit
+    )
+
+
+def test_same_day_games_share_pitch_limits():
+    limit = [2] * PLAYERS
+    problems = [_problem(limit), _problem(limit)]
+    matrices, parts = day_planner.plan_fielding(problems, time_budget=0.3, seed=1, days=["day", "day"])
+    pitched = sum((matrix == rm.CODE["Pitcher"]).sum(axis=1) for matrix in matrices)
+    assert parts["pitch_limit_excess"] == 0
+    assert pitched.max() <= 2
+
+def test_plans_have_no_rule_issues_and_report_the_day_bench():
+    matrices, parts = day_planner.plan_fielding([_problem(), _problem()], time_budget=0.3, seed=2)
+    assert parts["violations"] == 0
+    for matrix in matrices:
+        issues = rm.check(matrix)
+        assert not issues["missing"] and not issues["duplicates"]
+    benched = sum((matrix == rm.BENCH).sum(axis=1) for matrix in matrices)
+    assert benched.sum() == 2 * 6 * (PLAYERS - len(rm.FIELD_CODES))
+    assert parts["day_bench"] == (benched.min(), benched.max())
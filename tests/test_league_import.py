@@ -0,0 +1,79 @@
+import io
+
+import league_import
+
+
+HEADER = "Team,First Name,Last Name,Jersey Number\n"
+
+
+def _team_with_players(database, players, user_id=None):
+    session = database.get_db_session()
+    try:
+        team = database.Team(name="Tigers", league="", head_coach="", assistant_coach1="",
+                             assistant_coach2="", user_id=user_id)
+        session.add(team)
+        session.commit()
+        for first_name, last_name, jersey in players:
+            session.add(database.Player(team_id=team.id, first_name=first_name, last_name=last_name,
+                                        jersey_number=jersey))
+        session.commit()
+        return team.id
+    finally:
+        session.close()
+
+def _jerseys(database, team_id):
+    session = database.get_db_session()
+    try:
+        players = session.query(database.Player).filter(database.Player.team_id == team_id)
+        return {(p.first_name, p.last_name): p.jersey_number for p in players}
+    finally:
+        session.close()
+
+def _import(rows, user_id=None):
+    return list(league_import.import_rosters(io.StringIO(HEADER + rows), "roster.csv", user_id))
+
+
+def test_rejects_jersey_kept_by_existing_player(sqlite_db):
+    team_id = _team_with_players(sqlite_db, [("Ann", "Lee", "7")])
+    reports = _import("Tigers,Bo,Kim,7\nTigers,Cy,Day,9\n")
+    assert reports[0]["errors"] == [(2, "Jersey number 7 already belongs to Ann Lee on team Tigers")]
+    assert reports[0]["inserted"] == 1 and reports[0]["rejected"] == 1
+    assert _jerseys(sqlite_db, team_id) == {("Ann", "Lee"): "7", ("Cy", "Day"): "9"}
+
+def test_jersey_freed_by_accepted_move(sqlite_db):
+    team_id = _team_with_players(sqlite_db, [("Ann", "Lee", "7"), ("Bo", "Kim", "8")])
+    reports = _import("Tigers,Ann,Lee,8\nTigers,Bo,Kim,7\n")
+    assert reports[0]["errors"] == []
+    assert _jerseys(sqlite_db, team_id) == {("Ann", "Lee"): "8", ("Bo", "Kim"): "7"}
+
+def test_rejected_move_keeps_old_jersey_taken(sqlite_db):
+    # Ann's move to 8 fails (Bo keeps 8), so her 7 must not go to Cy
+    team_id = _team_with_players(sqlite_db, [("Ann", "Lee", "7"), ("Bo", "Kim", "8")])
+    reports = _import("Tigers,Ann,Lee,8\nTigers,Cy,Day,7\n")
+    rows = [row for row, _ in reports[0]["errors"]]
+    assert rows == [2, 3]
+    assert _jerseys(sqlite_db, team_id) == {("Ann", "Lee"): "7", ("Bo", "Kim"): "8"}
+
+def test_same_player_twice_in_file(sqlite_db):
+    team_id = _team_with_players(sqlite_db, [])
+    reports = _import("Tigers,Ann,Lee,7\nTigers,Ann,Lee,9\n")
+    assert reports[0]["errors"] == [(3, "Ann Lee is listed again for team Tigers, with jersey 9 after 7")]
+    assert _jerseys(sqlite_db, team_id) == {("Ann", "Lee"): "7"}
+
+def test_matches_unowned_team(sqlite_db):
+    team_id = _team_with_players(sqlite_db, [])
+    _import("Tigers,Ann,Lee,7\n", user_id=5)
+    session = sqlite_db.get_db_session()
+    try:
+        assert session.query(sqlite_db.Team).count() == 1
+    finally:
+        session.close()
+    assert _jerseys(sqlite_db, team_id) == {("Ann", "Lee"): "7"}
+
+def test_empty_file_reports_no_rows(sqlite_db):
+    for text in ("", HEADER):
+        reports = list(league_import.import_rosters(io.StringIO(text), "roster.csv", 1))
+        assert reports == [{
+            "chunk": 0, "rows": 0, "inserted": 0, "updated": 0, "rejected": 0,
+            "seconds": 0.0, "rows_per_second": 0.0, "errors": [(None, "The file contains no rows")]
+        }]
@@ -0,0 +1,32 @@
+import pdf_cache
+
+
+def test_content_hash_ignores_key_order_and_tracks_template_version():
+    first = pdf_cache.game_content_hash({"a": 1, "b": [1, 2]}, 1)
+    assert first == pdf_cache.game_content_hash({"b": [1, 2], "a": 1}, 1)
+    assert first != pdf_cache.game_content_hash({"a": 1, "b": [1, 2]}, 2)
+
+def test_evicts_least_recently_used_past_the_byte_budget():
+    cache = pdf_cache.RenderCache(byte_budget=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+    cache.put("c", b"cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa" and cache.get("c") == b"cccc"
+    assert cache.stats()["bytes"] == 8
+
+def test_skips_documents_larger_than_the_budget():
+    cache = pdf_cache.RenderCache(byte_budget=4)
+    cache.put("a", b"aaaa")
+    cache.put("big", b"bbbbbbbb")
+    assert cache.get("big") is None and cache.get("a") == b"aaaa"
+
+def test_alias_follows_its_content_key():
+    cache = pdf_cache.RenderCache(byte_budget=8)
+    assert cache.get_alias("team-1") is None
+    cache.put("hash", b"pdf")
+    cache.put_alias("team-1", "hash")
+    assert cache.get_alias("team-1") == b"pdf"
+    cache.clear()
+    assert cache.get_alias("team-1") is None
@@ -0,0 +1,89 @@
+import numpy as np
+
+import pitching
+import rotation_matrix as rm
+
+JERSEYS = ["1", "2"]
+PITCHER = rm.CODE["Pitcher"]
+
+
+def _game(*pitched, innings=6):
+    """One game's players x innings matrix with each player pitching the given innings"""
+    matrix = np.full((len(JERSEYS), innings), rm.BENCH, dtype=np.int8)
+    for row, count in enumerate(pitched):
+        matrix[row, :count] = PITCHER
+    return matrix
+
+def _ledger(games):
+    """Ledger from (date, (innings pitched per player)) pairs"""
+    season = np.stack([_game(*pitched) for _, pitched in games]) if games else np.zeros((0, 2, 6), dtype=np.int8)
+    return pitching.PitchingLedger.from_season(season, [date for date, _ in games], JERSEYS)
+
+
+def test_rest_after_an_earlier_outing():
+    ledger = _ledger([("2026-05-04", (4, 3))])
+    limits, reasons = ledger.limits(JERSEYS, "2026-05-05")
+    assert list(limits) == [0, 0]
+    assert reasons[0] == "pitched 4 inning(s) 1 day(s) earlier and needs 2 day(s) of rest"
+    limits, _ = ledger.limits(JERSEYS, "2026-05-06")
+    assert list(limits) == [0, 4]
+    limits, _ = ledger.limits(JERSEYS, "2026-05-07")
+    assert list(limits) == [4, 4]
+
+def test_later_outing_caps_an_earlier_day():
+    ledger = _ledger([("2026-05-05", (2, 2))])
+    limits, reasons = ledger.limits(JERSEYS, "2026-05-04")
+    # 3 innings would need a day of rest before tomorrow's outing
+    assert list(limits) == [2, 2]
+    assert reasons[0] == "pitches 2 inning(s) 1 day(s) later and needs the rest before it"
+    # Two days ahead only 4 or more innings would need longer rest
+    limits, _ = ledger.limits(JERSEYS, "2026-05-03")
+    assert list(limits) == [3, 3]
+    limits, _ = ledger.limits(JERSEYS, "2026-05-02")
+    assert list(limits) == [4, 4]
+
+def test_check_reports_a_game_that_breaks_a_later_outing():
+    ledger = _ledger([("2026-05-05", (2, 0))])
+    issues = ledger.check(JERSEYS, "2026-05-04", _game(4, 0))
+    assert issues == [(0, 4, 2, "pitches 2 inning(s) 1 day(s) later and needs the rest before it")]
+
+def test_window_counts_earlier_days():
+    ledger = _ledger([("2026-05-01", (3, 0)), ("2026-05-04", (3, 0))])
+    limits, reasons = ledger.limits(JERSEYS, "2026-05-07")
+    assert list(limits) == [2, 4]
+    assert reasons[0] == "pitched 6 inning(s) in the last 7 days"
+    # 2026-05-01 has left the window
+    limits, _ = ledger.limits(JERSEYS, "2026-05-08")
+    assert list(limits) == [4, 4]
+
+def test_window_counts_later_days():
+    ledger = _ledger([("2026-05-04", (3, 0)), ("2026-05-07", (3, 0))])
+    limits, reasons = ledger.limits(JERSEYS, "2026-05-10")
+    assert list(limits) == [2, 4]
+    assert reasons[0] == "pitched 6 inning(s) in the last 7 days"
+    limits, reasons = ledger.limits(JERSEYS, "2026-05-01")
+    assert list(limits) == [2, 4]
+    assert reasons[0] == "pitches 6 inning(s) in the 7 days ending 6 day(s) later, counting later games"
+
+def test_same_day_innings_count_against_the_day():
+    ledger = _ledger([("2026-05-04", (3, 0))])
+    limits, reasons = ledger.limits(JERSEYS, "2026-05-04")
+    assert list(limits) == [1, 4]
+    assert reasons[0] == "already pitched 3 inning(s) that day"
+
+def test_undated_games_count_on_the_last_dated_day():
+    ledger = _ledger([("2026-05-04", (2, 0)), (None, (2, 0))])
+    limits, reasons = ledger.limits(JERSEYS, None)
+    assert list(limits) == [0, 4]
+    assert reasons[0].startswith("already pitched 4 inning(s) that day (the game has no date")
+    ledger = _ledger([(None, (4, 0))])
+    limits, reasons = ledger.limits(JERSEYS, None)
+    assert list(limits) == [4, 4] and reasons == ["", ""]
+
+def test_apply_moves_a_game_onto_its_day():
+    ledger = _ledger([("2026-05-04", (0, 0))])
+    moved = ledger.apply(JERSEYS, "2026-05-10", _game(0, 0), _game(4, 0))
+    assert list(moved.limits(JERSEYS, "2026-05-11")[0]) == [0, 4]
+    assert list(moved.limits(JERSEYS, "2026-05-09")[0]) == [2, 4]
+    assert list(moved.limits(JERSEYS, "2026-05-08")[0]) == [3, 4]
+    assert list(ledger.limits(JERSEYS, "2026-05-11")[0]) == [4, 4]
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import rotation_matrix as rm
+
+
+ROTATION = {
+    "Inning 1": {"7": "Pitcher", "9": "Bench"},
+    "Inning 2": {"7": "Bench", "9": "Pitcher", "12": "OUT"},
+}
+
+
+def test_encode_decode_round_trip():
+    matrix, jerseys = rm.encode(ROTATION, ["9", "7"])
+    assert jerseys == ["9", "7", "12"]
+    assert matrix.tolist() == [[rm.BENCH, rm.CODE["Pitcher"]], [rm.CODE["Pitcher"], rm.BENCH], [rm.EMPTY, rm.OUT]]
+    assert rm.decode(matrix, jerseys) == {"Inning 1": {"9": "Bench", "7": "Pitcher"},
+                                          "Inning 2": {"9": "Pitcher", "7": "Bench", "12": "OUT"}}
+
+def test_unknown_positions_raise_unless_not_strict():
+    with pytest.raises(ValueError):
+        rm.encode({"Inning 1": {"7": "Shortstop"}})
+    matrix, _ = rm.encode({"Inning 1": {"7": "Shortstop"}}, strict=False)
+    assert matrix.tolist() == [[rm.EMPTY]]
+
+def test_encode_season_pads_and_drops_unlisted_jerseys():
+    tensor, numbers = rm.encode_season({3: ROTATION}, ["7"], 3)
+    assert numbers == [3]
+    assert tensor[0].tolist() == [[rm.CODE["Pitcher"], rm.BENCH, rm.EMPTY]]
+
+def test_check_reports_missing_duplicate_and_consecutive():
+    matrix = np.full((11, 2), rm.BENCH, dtype=np.int8)
+    matrix[:10, 0] = rm.FIELD_CODES
+    matrix[:10, 1] = rm.FIELD_CODES
+    matrix[9, 1] = rm.CODE["SS"]
+    issues = rm.check(matrix)
+    assert issues["missing"] == [(2, [rm.CODE["RC"]])]
+    assert issues["duplicates"] == [(2, [rm.CODE["SS"]])]
+    # Everyone kept their category from inning 1 to 2; RC moving to SS went outfield to infield
+    assert len(issues["consecutive"]) == 9
+    assert [row for row, _ in issues["repeated"]] == list(range(9))
+
+def test_ledger_apply_moves_innings_between_categories():
+    tensor, _ = rm.encode_season({1: ROTATION}, ["7", "9"], 2)
+    ledger = rm.FairnessLedger.from_season(tensor, ["7", "9"])
+    stored = tensor[0]
+    edited = stored.copy()
+    edited[0, 1] = rm.CODE["LF"]
+    moved = ledger.apply(["7", "9"], stored, edited)
+    assert moved.counts[0, :rm.NONE_CAT].tolist() == [1, 1, 0, 0]
+    assert ledger.counts[0, :rm.NONE_CAT].tolist() == [1, 0, 1, 0]
@@ -0,0 +1,54 @@
+import numpy as np
+
+import rotation_matrix as rm
+import rotation_solver
+
+
+def _violations(matrix):
+    per_player = rm.position_counts(matrix, axis=1)[:, rm.FIELD_CODES]
+    can_catch = np.ones(len(matrix), dtype=bool)
+    return rotation_solver.count_violations(matrix, rm.categories(matrix), per_player, can_catch)
+
+def _check_total(matrix):
+    issues = rm.check(matrix)
+    repeated = sum(count - 1 for _, codes in issues["repeated"] for count in codes.values())
+    return repeated + len(issues["consecutive"])
+
+def _problem(players=12, innings=6):
+    return rotation_solver.Problem(
+        [str(jersey) for jersey in range(players)], [True] * players, [True] * players, innings,
+        np.zeros((players, len(rm.CATEGORY_NAMES)), dtype=np.int32),
+        np.zeros((players, len(rm.CODES)), dtype=np.int32)
+    )
+
+
+def test_repeat_after_a_bench_inning_is_not_counted():
+    matrix = np.full((2, 4), rm.BENCH, dtype=np.int8)
+    matrix[0] = [rm.CATCHER, rm.BENCH, rm.CATCHER, rm.BENCH]
+    matrix[1] = [rm.CATCHER, rm.CODE["1B"], rm.CATCHER, rm.CODE["2B"]]
+    assert [row for row, _ in rm.check(matrix)["repeated"]] == [1]
+    assert _violations(matrix) == _check_total(matrix) == 1
+
+def test_count_violations_agrees_with_check_on_random_games():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        matrix = rng.integers(0, rm.BENCH + 1, size=(11, 6)).astype(np.int8)
+        assert _violations(matrix) == _check_total(matrix)
+
+def test_constructed_rotations_agree_with_check():
+    problem = _problem()
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        matrix = rotation_solver.construct(problem, rng)
+        assert _violations(matrix) == _check_total(matrix)
+
+def test_worker_error_falls_back_to_in_process_search(monkeypatch, capsys):
+    class FailingPool:
+        def submit(self, *args):
+            raise ValueError("worker exploded")
+
+    monkeypatch.setattr(rotation_solver, "_get_pool", lambda workers: FailingPool())
+    monkeypatch.setattr(rotation_solver.os, "cpu_count", lambda: 2)
+    candidates, tried = rotation_solver.search(_problem(), k=2, time_budget=0.1, workers=2, seed=1)
+    assert candidates and tried >= 1
+    assert "worker exploded" in capsys.readouterr().out
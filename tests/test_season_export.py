@@ -0,0 +1,49 @@
+import csv
+import io
+import os
+import zipfile
+
+import season_export
+
+
+def _team(database):
+    session = database.get_db_session()
+    try:
+        team = database.Team(name="Tigers", league="", head_coach="", assistant_coach1="", assistant_coach2="")
+        session.add(team)
+        session.commit()
+        session.add_all([
+            database.Player(team_id=team.id, first_name="Ann", last_name="Lee", jersey_number="7"),
+            database.Game(team_id=team.id, game_number=1, opponent="Hawks", innings=6),
+        ])
+        session.commit()
+    finally:
+        session.close()
+
+
+def test_csv_export_to_tempfile(sqlite_db):
+    _team(sqlite_db)
+    path, counts = season_export.export_season_to_tempfile(1, "csv", batch_size=1)
+    try:
+        assert counts == {"players": 1, "games": 1, "batting_orders": 0, "fielding_rotations": 0, "availability": 0}
+        with zipfile.ZipFile(path) as archive:
+            assert sorted(archive.namelist()) == sorted(f"{name}.csv" for name in season_export.EXPORT_TABLES)
+            rows = list(csv.reader(io.TextIOWrapper(archive.open("players.csv"), encoding="utf-8")))
+        assert rows[0] == season_export.EXPORT_TABLES["players"]
+        assert rows[1][3:] == ["Ann", "Lee", "7"]
+    finally:
+        os.remove(path)
+
+def test_remove_stale_exports(sqlite_db):
+    _team(sqlite_db)
+    stale, _ = season_export.export_season_to_tempfile(1)
+    fresh, _ = season_export.export_season_to_tempfile(1)
+    try:
+        os.utime(stale, (0, 0))
+        assert season_export.remove_stale_exports() >= 1
+        assert not os.path.exists(stale)
+        assert os.path.exists(fresh)
+    finally:
+        for path in (stale, fresh):
+            if os.path.exists(path):
+                os.remove(path)